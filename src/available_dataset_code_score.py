@@ -1,9 +1,69 @@
 import os
 import re
 import time
+from functools import lru_cache
 from typing import Tuple, Optional, Set
-
-from license_sub_score import fetch_readme
+from urllib.parse import urlparse
+
+# Relative when loaded as src.*, flat when src/ itself is on sys.path
+try:
+    from .license_sub_score import fetch_readme
+except ImportError:
+    from license_sub_score import fetch_readme  # type: ignore[no-redef]
+
+# Common dataset hosting platforms and patterns. Only "any match?" matters,
+# so the list is ordered from most to least commonly hit, and patterns
+# implied by another entry (e.g. '##?\s*Dataset' by '##?\s*Data') are
+# omitted. The URL patterns backtrack the most and go last.
+DATASET_PATTERNS = [
+    r'dataset[:\s]',
+    r'##?\s*Data',
+    r'training\s+data',
+    r'test\s+data',
+    r'validation\s+data',
+    # Any URL pointing at data: one pass per link covers the data-ish path,
+    # the dataset hosts and the data file extensions. 'data' already
+    # covers 'dataset' and huggingface.co/datasets, and '.json' covers
+    # '.jsonl'.
+    r'https?://[^\s]*(?:data|kaggle|zenodo|figshare|drive\.google\.com|'
+    r'\.(?:csv|json|parquet|tsv|txt|zip|tar\.gz|tar\.bz2))',
+    r'\[.*\]\([^)]*\.(csv|json|jsonl|parquet|tsv|txt|zip|tar\.gz|'
+    r'tar\.bz2)',
+]
+
+# Patterns for code examples and scripts, ordered the same way. An opening
+# code fence already implies the complete-block case, so only it is kept.
+CODE_PATTERNS = [
+    r'```[a-zA-Z]*\n',         # Code blocks (complete or not)
+    r'from\s+',
+    r'import\s+',
+    r'pip\s+install',
+    r'python\s+',
+    r'##?\s*Usage',
+    r'##?\s*Example',
+    r'##?\s*Installation',
+    r'##?\s*Quick\s+start',
+    r'##?\s*Code',
+    r'def\s+',
+    r'class\s+',
+    r'\.py\b',                  # Python files
+    r'\.ipynb\b',               # Jupyter notebooks
+    r'\.sh\b',                  # Shell scripts
+    r'\.js\b',                  # JavaScript files
+    r'\.java\b',                # Java files
+    r'\.cpp\b',                 # C++ files
+    r'\.c\b',                   # C files
+    r'<code>',
+    r'<pre>',
+    r'function\s*\(',
+]
+
+# Each pattern list is fused into a single alternation compiled once at
+# import, so a README is scanned in one pass instead of once per pattern.
+_DATASET_RE = re.compile("|".join(f"(?:{p})" for p in DATASET_PATTERNS),
+                         re.IGNORECASE | re.MULTILINE)
+_CODE_RE = re.compile("|".join(f"(?:{p})" for p in CODE_PATTERNS),
+                      re.IGNORECASE | re.MULTILINE)
 
 
 def detect_dataset_links(readme_text: str) -> bool:
@@ -14,30 +74,7 @@ def detect_dataset_links(readme_text: str) -> bool:
     if not readme_text:
         return False
 
-    # Common dataset hosting platforms and patterns
-    dataset_patterns = [
-        r'https?://[^\s]*\.(csv|json|jsonl|parquet|tsv|txt|zip|tar\.gz|'
-        r'tar\.bz2)',
-        r'https?://[^\s]*(dataset|data)[^\s]*',
-        r'https?://[^\s]*(kaggle|huggingface\.co/datasets|zenodo|figshare|'
-        r'drive\.google\.com)',
-        r'\[.*\]\([^)]*\.(csv|json|jsonl|parquet|tsv|txt|zip|tar\.gz|'
-        r'tar\.bz2)',
-        r'##?\s*Dataset',
-        r'##?\s*Data',
-        r'dataset[:\s]',
-        r'training\s+data',
-        r'test\s+data',
-        r'validation\s+data',
-    ]
-
-    readme_lower = readme_text.lower()
-
-    for pattern in dataset_patterns:
-        if re.search(pattern, readme_lower, re.IGNORECASE):
-            return True
-
-    return False
+    return bool(_DATASET_RE.search(readme_text))
 
 
 def detect_code_examples(readme_text: str) -> bool:
@@ -48,84 +85,81 @@ def detect_code_examples(readme_text: str) -> bool:
     if not readme_text:
         return False
 
-    # Patterns for code examples and scripts
-    code_patterns = [
-        r'```[a-zA-Z]*\n.*\n```',  # Code blocks
-        r'```[a-zA-Z]*\n.*',       # Incomplete code blocks
-        r'\.py\b',                  # Python files
-        r'\.js\b',                  # JavaScript files
-        r'\.java\b',                # Java files
-        r'\.cpp\b',                 # C++ files
-        r'\.c\b',                   # C files
-        r'\.sh\b',                  # Shell scripts
-        r'\.ipynb\b',               # Jupyter notebooks
-        r'##?\s*Usage',
-        r'##?\s*Example',
-        r'##?\s*Code',
-        r'##?\s*Installation',
-        r'##?\s*Quick\s+start',
-        r'pip\s+install',
-        r'python\s+',
-        r'import\s+',
-        r'from\s+',
-        r'def\s+',
-        r'class\s+',
-        r'function\s*\(',
-        r'<code>',
-        r'<pre>',
-    ]
-
-    readme_lower = readme_text.lower()
-
-    for pattern in code_patterns:
-        if re.search(pattern, readme_lower, re.IGNORECASE | re.MULTILINE):
-            return True
+    return bool(_CODE_RE.search(readme_text))
 
-    return False
 
+def _extract_link_identifier(link: str, host_marker: str,
+                             split_marker: str) -> str:
+    """
+    Extract a unique identifier from a resource link.
 
-def extract_code_identifier(code_link: str) -> str:
-    """Extract a unique identifier from a code link."""
-    if not code_link:
+    Links on the known host (host_marker) are keyed by everything after
+    split_marker; any other link falls back to domain + path.
+    """
+    if not link:
         return ""
 
-    # Handle GitHub links
-    if "github.com" in code_link:
-        # Extract repo name from URL like
-        # https://github.com/google-research/bert
-        parts = code_link.split("github.com/")
+    if host_marker in link:
+        parts = link.split(split_marker)
         if len(parts) > 1:
             return parts[1].strip("/")
 
-    # Handle other code links - use domain + path
+    # Handle other links - use domain + path
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(code_link)
+        parsed = urlparse(link)
         return f"{parsed.netloc}{parsed.path}".strip("/")
     except Exception:
-        return code_link.lower().strip()
+        return link.lower().strip()
+
+
+def extract_code_identifier(code_link: str) -> str:
+    """Extract a unique identifier from a code link."""
+    # GitHub links are keyed by repo name, e.g.
+    # https://github.com/google-research/bert -> google-research/bert
+    return _extract_link_identifier(code_link, "github.com", "github.com/")
 
 
 def extract_dataset_identifier_code(dataset_link: str) -> str:
     """Extract a unique identifier from a dataset link."""
-    if not dataset_link:
-        return ""
+    # Hugging Face dataset links are keyed by dataset name, e.g.
+    # https://huggingface.co/datasets/bookcorpus/bookcorpus
+    return _extract_link_identifier(dataset_link, "huggingface.co/datasets/",
+                                    "/datasets/")
 
-    # Handle Hugging Face dataset links
-    if "huggingface.co/datasets/" in dataset_link:
-        # Extract dataset name from URL like
-        # https://huggingface.co/datasets/bookcorpus/bookcorpus
-        parts = dataset_link.split("/datasets/")
-        if len(parts) > 1:
-            return parts[1].strip("/")
 
-    # Handle other dataset links - use domain + path
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(dataset_link)
-        return f"{parsed.netloc}{parsed.path}".strip("/")
-    except Exception:
-        return dataset_link.lower().strip()
+@lru_cache(maxsize=None)
+def _resource_terms(resource_id: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Return a resource's lowercased ID and the name parts (longer than three
+    characters) used for partial matches. Depends only on the ID, so it is
+    computed once per resource rather than once per README.
+    """
+    resource_lower = resource_id.lower()
+    resource_parts = resource_lower.replace("/", " ").replace(
+        "-", " ").replace("_", " ").split()
+    return resource_lower, tuple(part for part in resource_parts
+                                 if len(part) > 3)
+
+
+def mentions_known_resource(readme_lower: str,
+                            resource_ids: set[str]) -> bool:
+    """Check if a lowercased README mentions any of the given resources."""
+    # Parts such as an org name recur across resources; probe each once
+    part_hits: dict[str, bool] = {}
+    for resource_id in resource_ids:
+        resource_lower, resource_parts = _resource_terms(resource_id)
+        if resource_lower in readme_lower:
+            return True
+        # Check for parts of the resource name
+        if len(resource_parts) >= 2:
+            parts_found = 0
+            for part in resource_parts:
+                if part not in part_hits:
+                    part_hits[part] = part in readme_lower
+                parts_found += part_hits[part]
+            if parts_found >= 2:
+                return True
+    return False
 
 
 def check_readme_for_known_resources(readme: str,
@@ -133,46 +167,16 @@ def check_readme_for_known_resources(readme: str,
                                      encountered_code: set[str]
                                      ) -> tuple[bool, bool]:
     """Check if README mentions previously encountered datasets or code."""
-    if not readme:
+    # Lowercasing copies the whole README, so skip it when there is
+    # nothing to look for (the usual case once direct links are found)
+    if not readme or not (encountered_datasets or encountered_code):
         return False, False
 
     readme_lower = readme.lower()
 
-    # Check for datasets
-    has_known_dataset = False
-    if encountered_datasets:
-        for dataset_id in encountered_datasets:
-            dataset_lower = dataset_id.lower()
-            if dataset_lower in readme_lower:
-                has_known_dataset = True
-                break
-            # Check for parts of the dataset name
-            dataset_parts = dataset_lower.replace("/", " ").replace(
-                "-", " ").replace("_", " ").split()
-            if len(dataset_parts) >= 2:
-                parts_found = sum(1 for part in dataset_parts
-                                  if len(part) > 3 and part in readme_lower)
-                if parts_found >= 2:
-                    has_known_dataset = True
-                    break
-
-    # Check for code
-    has_known_code = False
-    if encountered_code:
-        for code_id in encountered_code:
-            code_lower = code_id.lower()
-            if code_lower in readme_lower:
-                has_known_code = True
-                break
-            # Check for parts of the code repo name
-            code_parts = code_lower.replace("/", " ").replace(
-                "-", " ").replace("_", " ").split()
-            if len(code_parts) >= 2:
-                parts_found = sum(1 for part in code_parts
-                                  if len(part) > 3 and part in readme_lower)
-                if parts_found >= 2:
-                    has_known_code = True
-                    break
+    has_known_dataset = mentions_known_resource(readme_lower,
+                                                encountered_datasets)
+    has_known_code = mentions_known_resource(readme_lower, encountered_code)
 
     return has_known_dataset, has_known_code
 
@@ -197,10 +201,10 @@ def available_dataset_code_score(model_id: str, code_link: str = "",
     Returns:
         Tuple of (score, execution_time)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     if not model_id or not model_id.strip():
-        end_time = time.time()
+        end_time = time.perf_counter()
         return (0.0, end_time - start_time)
 
     if encountered_datasets is None:
@@ -229,16 +233,18 @@ def available_dataset_code_score(model_id: str, code_link: str = "",
                 dataset_available = detect_dataset_links(readme_text)
             if not has_external_code:
                 code_available = detect_code_examples(readme_text)
-            # Also check for references to known resources
+            # Fall back to references to known resources. Each known-resource
+            # scan costs O(resources x README), so only scan for the kinds
+            # that are not already available.
             has_known_dataset, has_known_code = (
                 check_readme_for_known_resources(
-                    readme_text, encountered_datasets, encountered_code))
+                    readme_text,
+                    set() if dataset_available else encountered_datasets,
+                    set() if code_available else encountered_code))
 
             # Update availability based on references (if not already found)
-            if not has_external_dataset and not dataset_available:
-                dataset_available = has_known_dataset
-            if not has_external_code and not code_available:
-                code_available = has_known_code
+            dataset_available = dataset_available or has_known_dataset
+            code_available = code_available or has_known_code
 
     # Add external resources to tracking sets for future models
     if has_external_code:
@@ -258,7 +264,7 @@ def available_dataset_code_score(model_id: str, code_link: str = "",
     else:
         score = 0.0  # Neither available
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     execution_time = end_time - start_time
 
     if int(os.getenv("LOG_LEVEL", "0")) > 0:
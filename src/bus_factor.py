@@ -1,12 +1,109 @@
 import re
 import time
+from functools import lru_cache
 
 import requests
 
+# Relative when loaded as src.*, flat when src/ itself is on sys.path
+try:
+    from .hugging_face_api import SESSION
+except ImportError:
+    from hugging_face_api import SESSION  # type: ignore[no-redef]
+
+# Contributor count patterns on the Files page, tried in order
+CONTRIBUTOR_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s+contributors?',
+    r'contributors?\s+(\d+)',
+    r'\"contributors?\":\s*(\d+)',
+))
+_CONTRIBUTOR_WORD = re.compile('contributor', re.IGNORECASE)
+
+
+# Upper bound on cached contributor counts; one entry per scored model.
+CONTRIBUTORS_CACHE_SIZE = 256
+
+# The Files page is read in chunks of this many bytes, so the download can
+# stop as soon as the contributor count in the page header has been seen.
+PAGE_CHUNK_SIZE = 16384
+
+
+def _first_count(pattern: re.Pattern[str], content: str,
+                 pos: int = 0) -> int:
+    """Return the first positive count pattern captures at or after pos."""
+    for match in pattern.finditer(content, pos):
+        try:
+            count = int(match.group(1))
+            if count > 0:  # Valid contributor count
+                return count
+        except ValueError:
+            continue
+    return 0
+
+
+def _resume_position(content: str) -> int:
+    """
+    Return where to resume scanning once the next chunk is appended.
+
+    A count split across two chunks is a digit/whitespace run followed by
+    a partial "contributor" (shorter than the full word, or it would have
+    matched already). Back up over that much text, then to the start of
+    the digit/whitespace run, so rescanning from there misses nothing.
+    """
+    i = max(0, len(content) - len("contributor"))
+    while i and (content[i - 1].isdecimal() or content[i - 1].isspace()):
+        i -= 1
+    return i
+
+
+@lru_cache(maxsize=CONTRIBUTORS_CACHE_SIZE)
+def _count_contributors(model_id: str) -> int:
+    # Scrape the Files tab to get contributor count. Failures (including a
+    # non-200 page) raise, so only successfully parsed pages are cached.
+    files_url = f"https://huggingface.co/{model_id}/tree/main"
+    response = SESSION.get(files_url, timeout=15, stream=True)
+
+    try:
+        if response.status_code != 200:
+            raise requests.HTTPError(
+                f"{response.status_code} response for {files_url}")
+
+        if response.encoding is None:
+            response.encoding = "utf-8"
+
+        # The first (preferred) pattern is checked as the page arrives; a
+        # hit closes the response without downloading the file listing
+        # below it. Closing mid-stream drops that one keep-alive
+        # connection, which costs less than reading the rest of the page.
+        content = ""
+        for chunk in response.iter_content(chunk_size=PAGE_CHUNK_SIZE,
+                                           decode_unicode=True):
+            pos = _resume_position(content)
+            content += chunk
+            count = _first_count(CONTRIBUTOR_PATTERNS[0], content, pos)
+            if count:
+                return count
+    finally:
+        response.close()
+
+    # Every pattern needs the word "contributor"; most of the page is the
+    # file listing, so skip the pattern scans when it never appears.
+    if not _CONTRIBUTOR_WORD.search(content):
+        return 0
+
+    # Fall back to the remaining patterns over the whole page. finditer stops
+    # at the first valid count instead of collecting every match.
+    for pattern in CONTRIBUTOR_PATTERNS[1:]:
+        count = _first_count(pattern, content)
+        if count:
+            return count
+
+    return 0
+
 
 def get_huggingface_contributors(model_id: str) -> int:
     """
     Get the number of contributors directly from the Hugging Face Files page.
+    Counts are memoized per model ID, so repeat lookups skip the scrape.
 
     Args:
         model_id: The Hugging Face model ID
@@ -15,34 +112,10 @@ def get_huggingface_contributors(model_id: str) -> int:
         int: Number of contributors as shown in the Hugging Face UI
     """
     try:
-        # Scrape the Files tab to get contributor count
-        files_url = f"https://huggingface.co/{model_id}/tree/main"
-        response = requests.get(files_url, timeout=15)
-
-        if response.status_code == 200:
-            content = response.text
-
-            # Look for contributor count patterns in the Files page
-            contributor_patterns = [
-                r'(\d+)\s+contributors?',
-                r'contributors?\s+(\d+)',
-                r'\"contributors?\":\s*(\d+)',
-            ]
-
-            for pattern in contributor_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    # Return the first valid number found
-                    for match in matches:
-                        try:
-                            count = int(match)
-                            if count > 0:  # Valid contributor count
-                                return count
-                        except ValueError:
-                            continue
-
+        return _count_contributors(model_id)
+    except requests.HTTPError:
+        # Files page not available; not cached, so a later call retries
         return 0
-
     except Exception as e:
         print(f"Error getting Hugging Face contributors for {model_id}: {e}")
         return 0
@@ -60,9 +133,9 @@ def bus_factor_score(model_id: str) -> tuple[int, float]:
     Returns:
         tuple[int, float]: (Number of unique contributors, execution time)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     contributors = get_huggingface_contributors(model_id)
-    end_time = time.time()
+    end_time = time.perf_counter()
     execution_time = end_time - start_time
 
     return contributors, execution_time
@@ -74,9 +147,9 @@ if __name__ == "__main__":
     print("Testing bus factor calculation...")
 
     # Time the function call from outside
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = bus_factor_score("moonshotai/Kimi-K2-Instruct-0905")
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     execution_time = end_time - start_time
     print(f"Bus factor score: {result}")
@@ -1,8 +1,204 @@
 import re
 import time
-from typing import Optional, Tuple, Set
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# Relative when loaded as src.*, flat when src/ itself is on sys.path
+try:
+    from .available_dataset_code_score import mentions_known_resource
+    from .license_sub_score import fetch_readme
+    from .purdue_api import PurdueGenAI
+except ImportError:
+    # isort: off
+    from available_dataset_code_score import (  # type: ignore[no-redef]
+        mentions_known_resource)
+    # isort: on
+    from license_sub_score import fetch_readme  # type: ignore[no-redef]
+    from purdue_api import PurdueGenAI  # type: ignore[no-redef]
+
+# Upper bound on memoized LLM responses (three aspects per scored model)
+AI_RESPONSE_CACHE_SIZE = 512
+
+# First number in an LLM reply, e.g. "0.75" or "Score: 1"
+_AI_SCORE_RE = re.compile(r'(\d+\.?\d*)')
+
+# What the LLM rates for each aspect, and the example rating its prompt
+# shows. The batched and the per-aspect prompts are both built from this
+# table, so they always ask for the same criteria.
+_AI_ASPECT_CRITERIA = {
+    'documentation': ('dataset description, size/format info, usage '
+                      'instructions, technical details', '0.75'),
+    'safety': ('privacy mentions, bias discussions, safety warnings, '
+               'ethical considerations', '0.65'),
+    'curation': ('quality processes, validation methods, performance '
+                 'metrics, standards', '0.80'),
+}
+
+# Aspects rated by the LLM, and one "aspect: number" line of a batched reply.
+# The number must follow the separator and end the line, so digits inside
+# a label such as "documentation (1-10): 7" are never taken as the score.
+AI_ASPECTS = tuple(_AI_ASPECT_CRITERIA)
+_AI_ASPECT_SCORE_RE = re.compile(
+    r'(' + '|'.join(AI_ASPECTS) + r')\s*[:=-]\s*(\d+(?:\.\d+)?)\s*$',
+    re.IGNORECASE | re.MULTILINE)
+
+# README characters included in an LLM prompt
+AI_README_CHARS = 1500
+
+
+def _ai_prompt(aspects: Tuple[str, ...]) -> str:
+    """
+    Build the LLM prompt template asking for a 0.0-1.0 rating of each aspect.
 
-from src.license_sub_score import fetch_readme
+    The template is filled in with str.format(model_id=..., readme=...).
+    It starts with its fixed instructions and only then the model ID and
+    README, so successive calls share a byte-identical prefix that
+    server-side prompt/prefix caches can reuse.
+    """
+    criteria = '\n'.join(f'{aspect}: {_AI_ASPECT_CRITERIA[aspect][0]}.'
+                         for aspect in aspects)
+    examples = '\n'.join(f'{aspect}: {_AI_ASPECT_CRITERIA[aspect][1]}'
+                         for aspect in aspects)
+    return ('\nAnalyze this ML model README and rate each aspect below '
+            '0.0-1.0.\n' + criteria + '\nModel: "{model_id}"\n'
+            'README: {readme}\n'
+            'Respond with only one line per aspect, for example:\n' +
+            examples)
+
+
+# LLM prompt templates, built once at import: one per aspect for the
+# standalone hybrid evaluators, and one rating every aspect at once
+_AI_PROMPTS = {aspect: _ai_prompt((aspect,)) for aspect in AI_ASPECTS}
+_AI_BATCH_PROMPT = _ai_prompt(AI_ASPECTS)
+
+# Only the first 64K characters of a README are scored. The sections the
+# criteria look for sit near the top; anything past this is typically
+# citations or appendices, and the cap bounds the scan cost per model.
+MAX_README_CHARS = 65536
+
+# Regex criteria compiled once at import rather than on every evaluation.
+# Each word-boundary criterion is a single alternation, so the README is
+# scanned once per criterion instead of once per keyword.
+_DATASET_RE = re.compile(
+    r'\b(?:dataset|training data|training set|data set|corpus|collection'
+    r'|specification)\b'
+)
+
+# Size information: a count followed by a unit, or an explicit size/contains
+# phrase. Optional plural suffixes are dropped since search() does not need
+# them to match. Matched against the lowercased README, so no IGNORECASE.
+_SIZE_RE = re.compile(
+    r'\d+\s*(?:[gmkt]b|(?:giga|mega|kilo|tera)byte|row|sample|example'
+    r'|instance|record)'
+    r'|size[:\s]+\d+'
+    r'|contains?\s+\d+'
+)
+
+_SCHEMA_RE = re.compile(
+    r'\b(?:column|field|attribute|feature|schema|metadata|annotation'
+    r'|label)\b'
+)
+
+_QUALITY_RE = re.compile(
+    r'\b(?:quality|curated|verified|validated|checked|reviewed|filtered'
+    r'|cleaned|processed|preprocessed|standardized|normalized)\b'
+)
+
+# Substring keyword lists for each criterion, built once at import rather
+# than rebuilt as lists on every evaluation.
+_FORMAT_KEYWORDS = (
+    'csv', 'json', 'jsonl', 'parquet', 'tsv', 'txt', 'hdf5', 'feather',
+    'format', 'structure', 'file format', 'data format'
+)
+
+_USAGE_KEYWORDS = (
+    'usage', 'how to', 'load', 'download', 'access', 'install', 'tutorial',
+    'guide', 'example', 'quickstart', 'getting started'
+)
+
+_LICENSE_KEYWORDS = (
+    'license', 'licence', 'terms', 'agreement', 'permission', 'copyright',
+    'legal', 'rights', 'usage rights'
+)
+
+# Matched as substrings, so 'gpl' already covers 'lgpl'
+_SPECIFIC_LICENSES = (
+    'mit', 'apache', 'gpl', 'bsd', 'cc0', 'cc-by', 'public domain',
+    'open source', 'free to use', 'commercial use', 'academic use',
+    'creative commons', 'attribution', 'redistribution'
+)
+
+_RESTRICTION_KEYWORDS = (
+    'restriction', 'limitation', 'prohibited', 'not allowed', 'forbidden',
+    'cannot', 'must not', 'restricted use'
+)
+
+_PRIVACY_KEYWORDS = (
+    'privacy', 'personal', 'pii', 'anonymized', 'anonymised', 'de-identified',
+    'confidential', 'sensitive', 'data protection', 'gdpr', 'ccpa',
+    'personal information', 'private data', 'data privacy'
+)
+
+_SAFETY_KEYWORDS = (
+    'safety', 'bias', 'fairness', 'ethical', 'responsible', 'harmful',
+    'content warning', 'disclaimer', 'risks', 'limitations', 'toxicity',
+    'hate speech', 'inappropriate', 'offensive content', 'safety guidelines',
+    'ethical considerations'
+)
+
+_SOURCE_KEYWORDS = (
+    'source', 'origin', 'collected', 'gathered', 'obtained', 'derived',
+    'data source', 'origin of data', 'data collection', 'data gathering'
+)
+
+_VERSION_KEYWORDS = (
+    'version', 'v1', 'v2', 'v3', 'update', 'changelog', 'release', 'revision',
+    'iteration', 'edition', 'dataset version'
+)
+
+_STATS_KEYWORDS = (
+    'accuracy', 'precision', 'recall', 'f1', 'bleu', 'rouge', 'metric',
+    'statistic', 'benchmark', 'baseline', 'performance', 'evaluation',
+    'assessment', 'measurement'
+)
+
+_CODE_KEYWORDS = (
+    'code', 'github', 'repository', 'script', 'notebook', 'jupyter',
+    'source code', 'implementation', 'codebase'
+)
+
+_ENV_KEYWORDS = (
+    'environment', 'requirements', 'dependencies', 'install', 'setup',
+    'docker', 'conda', 'pip', 'package', 'library', 'framework',
+    'configuration'
+)
+
+_REPRO_KEYWORDS = (
+    'reproduce', 'reproducibility', 'replicate', 'replication', 'recreate',
+    'step by step', 'instructions', 'tutorial', 'guide', 'experiment',
+    'reproduce results', 'replication study'
+)
+
+
+def _readme_excerpt(readme_text: str) -> str:
+    """Return the leading part of a README that is sent to the LLM."""
+    if len(readme_text) > AI_README_CHARS:
+        return readme_text[:AI_README_CHARS] + '...'
+    return readme_text
+
+
+@lru_cache(maxsize=AI_RESPONSE_CACHE_SIZE)
+def _ask_ai(prompt: str) -> str:
+    """
+    Send a prompt to the LLM, memoizing the response by exact prompt text.
+
+    The prompt is fully determined by the model ID, aspect and README
+    excerpt, so re-scoring the same model skips the LLM round trip. Errors
+    propagate and are not cached.
+    """
+    client = PurdueGenAI()
+    return str(client.chat(prompt))
 
 
 def _get_ai_score(readme_text: str, model_id: str, aspect: str) -> float:
@@ -18,44 +214,17 @@ def _get_ai_score(readme_text: str, model_id: str, aspect: str) -> float:
         float: Score between 0.0 and 1.0, or 0.0 if AI unavailable
     """
     try:
-        from src.purdue_api import PurdueGenAI
-
-        # Create prompts for different aspects
-        prompts = {
-            'documentation': f"""
-Analyze the documentation quality of this ML model README for "{model_id}".
-Rate 0.0-1.0 based on: dataset description, size/format info, usage
-instructions, technical details.
-README: {readme_text[:1500]}{'...' if len(readme_text) > 1500 else ''}
-Respond with only a number (e.g., 0.75):""",
-
-            'safety': f"""
-Analyze safety/privacy considerations in this ML model README for
-"{model_id}".
-Rate 0.0-1.0 based on: privacy mentions, bias discussions, safety
-warnings, ethical considerations.
-README: {readme_text[:1500]}{'...' if len(readme_text) > 1500 else ''}
-Respond with only a number (e.g., 0.65):""",
-
-            'curation': f"""
-Analyze curation/quality control in this ML model README for
-"{model_id}".
-Rate 0.0-1.0 based on: quality processes, validation methods,
-performance metrics, standards.
-README: {readme_text[:1500]}{'...' if len(readme_text) > 1500 else ''}
-Respond with only a number (e.g., 0.80):"""
-        }
-
-        if aspect not in prompts:
+        if aspect not in _AI_PROMPTS:
             return 0.0
 
+        prompt = _AI_PROMPTS[aspect].format(
+            model_id=model_id, readme=_readme_excerpt(readme_text))
+
         # Make AI call
-        client = PurdueGenAI()
-        response = client.chat(prompts[aspect])
+        response = _ask_ai(prompt)
 
         # Extract score from response
-        import re
-        match = re.search(r'(\d+\.?\d*)', response.strip())
+        match = _AI_SCORE_RE.search(response.strip())
         if match:
             score = float(match.group(1))
             return min(1.0, max(0.0, score))
@@ -65,12 +234,54 @@ Respond with only a number (e.g., 0.80):"""
         return 0.0
 
 
-def evaluate_dataset_documentation(readme_text: Optional[str]) -> float:
+def _get_ai_scores(readme_text: str, model_id: str) -> Dict[str, float]:
+    """
+    Get AI scores for all three dataset quality aspects in one LLM call.
+
+    Asking once instead of once per aspect saves two round trips and sends
+    the README excerpt a single time.
+
+    Args:
+        readme_text: README content
+        model_id: Model identifier
+
+    Returns:
+        Dict[str, float]: Score between 0.0 and 1.0 for each aspect in
+        AI_ASPECTS; 0.0 for any aspect the AI was unavailable for or did
+        not rate
+    """
+    scores = dict.fromkeys(AI_ASPECTS, 0.0)
+    prompt = _AI_BATCH_PROMPT.format(model_id=model_id,
+                                     readme=_readme_excerpt(readme_text))
+
+    try:
+        response = _ask_ai(prompt)
+    except Exception:
+        # AI unavailable or failed, every aspect falls back to 0.0
+        return scores
+
+    # Keep the first in-range rating given for each aspect; a number off
+    # the 0.0-1.0 scale means the reply used some other scale, so it is
+    # not clamped into a score
+    rated = set()
+    for match in _AI_ASPECT_SCORE_RE.finditer(response):
+        aspect = match.group(1).lower()
+        score = float(match.group(2))
+        if aspect not in rated and 0.0 <= score <= 1.0:
+            rated.add(aspect)
+            scores[aspect] = score
+    return scores
+
+
+def evaluate_dataset_documentation(
+        readme_text: Optional[str],
+        readme_lower: Optional[str] = None) -> float:
     """
     Evaluate dataset documentation quality based on README content.
 
     Args:
         readme_text: The README content as string
+        readme_lower: readme_text already lowercased, if the caller has it
 
     Returns:
         float: Score between 0.0 and 1.0 for documentation quality
@@ -78,77 +289,43 @@ def evaluate_dataset_documentation(readme_text: Optional[str]) -> float:
     if not readme_text:
         return 0.0
 
-    score = 0.0
-    readme_lower = readme_text.lower()
+    score = 0  # tenths of a point
+    if readme_lower is None:
+        readme_lower = readme_text.lower()
 
     # Check for dataset description (0.2 points) - more specific with
     # word boundaries
-    dataset_patterns = [
-        r'\bdataset\b', r'\btraining data\b', r'\btraining set\b',
-        r'\bdata set\b', r'\bcorpus\b', r'\bcollection\b',
-        r'\bspecification\b'
-    ]
-
-    for pattern in dataset_patterns:
-        if re.search(pattern, readme_lower):
-            score += 0.2
-            break
+    if _DATASET_RE.search(readme_lower):
+        score += 2
 
     # Check for size information (0.2 points) - enhanced patterns
-    size_patterns = [
-        r'\d+\s*(gb|mb|kb|tb)',
-        r'\d+\s*(gigabytes?|megabytes?|kilobytes?|terabytes?)',
-        r'\d+\s*rows?',
-        r'\d+\s*samples?',
-        r'\d+\s*examples?',
-        r'\d+\s*instances?',
-        r'\d+\s*records?',
-        r'size[:\s]+\d+',
-        r'contains?\s+\d+'
-    ]
-
-    for pattern in size_patterns:
-        if re.search(pattern, readme_text, re.IGNORECASE):
-            score += 0.2
-            break
+    if _SIZE_RE.search(readme_lower):
+        score += 2
 
     # Check for format information (0.2 points) - more comprehensive
-    format_keywords = [
-        'csv', 'json', 'jsonl', 'parquet', 'tsv', 'txt', 'hdf5', 'feather',
-        'format', 'structure', 'file format', 'data format'
-    ]
-    if any(keyword in readme_lower for keyword in format_keywords):
-        score += 0.2
+    if any(keyword in readme_lower for keyword in _FORMAT_KEYWORDS):
+        score += 2
 
     # Check for column/field descriptions (0.2 points) - with word boundaries
-    schema_patterns = [
-        r'\bcolumn\b', r'\bfield\b', r'\battribute\b', r'\bfeature\b',
-        r'\bschema\b', r'\bmetadata\b', r'\bannotation\b', r'\blabel\b'
-    ]
-
-    for pattern in schema_patterns:
-        if re.search(pattern, readme_lower):
-            score += 0.2
-            break
+    if _SCHEMA_RE.search(readme_lower):
+        score += 2
 
     # Check for usage instructions (0.2 points) - more comprehensive
-    usage_keywords = [
-        'usage', 'how to', 'load', 'download', 'access', 'install',
-        'tutorial', 'guide', 'example', 'quickstart', 'getting started'
-    ]
-    if any(keyword in readme_lower for keyword in usage_keywords):
-        score += 0.2
+    if any(keyword in readme_lower for keyword in _USAGE_KEYWORDS):
+        score += 2
 
-    return min(1.0, score)
+    return score / 10
 
 
-def evaluate_license_clarity(readme_text: Optional[str]) -> float:
+def evaluate_license_clarity(readme_text: Optional[str],
+                             readme_lower: Optional[str] = None) -> float:
     """
     Evaluate license clarity for the dataset (different from license
     compatibility).
 
     Args:
         readme_text: The README content as string
+        readme_lower: readme_text already lowercased, if the caller has it
 
     Returns:
         float: Score between 0.0 and 1.0 for license clarity
@@ -156,46 +333,34 @@ def evaluate_license_clarity(readme_text: Optional[str]) -> float:
     if not readme_text:
         return 0.0
 
-    score = 0.0
-    readme_lower = readme_text.lower()
+    score = 0  # tenths of a point
+    if readme_lower is None:
+        readme_lower = readme_text.lower()
 
     # Check for explicit license mention (0.5 points) - more comprehensive
-    license_keywords = [
-        'license', 'licence', 'terms', 'agreement', 'permission',
-        'copyright', 'legal', 'rights', 'usage rights'
-    ]
-    if any(keyword in readme_lower for keyword in license_keywords):
-        score += 0.5
+    if any(keyword in readme_lower for keyword in _LICENSE_KEYWORDS):
+        score += 5
 
     # Check for specific license types (0.3 points) - more comprehensive
-    specific_licenses = [
-        'mit', 'apache', 'gpl', 'lgpl', 'bsd', 'cc0', 'cc-by',
-        'public domain', 'open source', 'free to use', 'commercial use',
-        'academic use', 'creative commons', 'attribution', 'redistribution'
-    ]
-
-    for license_type in specific_licenses:
-        if license_type in readme_lower:
-            score += 0.3
-            break
+    if any(license_type in readme_lower
+           for license_type in _SPECIFIC_LICENSES):
+        score += 3
 
     # Check for usage restrictions (0.2 points) - more comprehensive
-    restriction_keywords = [
-        'restriction', 'limitation', 'prohibited', 'not allowed', 'forbidden',
-        'cannot', 'must not', 'restricted use'
-    ]
-    if any(keyword in readme_lower for keyword in restriction_keywords):
-        score += 0.2
+    if any(keyword in readme_lower for keyword in _RESTRICTION_KEYWORDS):
+        score += 2
 
-    return min(1.0, score)
+    return score / 10
 
 
-def evaluate_safety_privacy(readme_text: Optional[str]) -> float:
+def evaluate_safety_privacy(readme_text: Optional[str],
+                            readme_lower: Optional[str] = None) -> float:
     """
     Evaluate safety and privacy considerations mentioned in the dataset.
 
     Args:
         readme_text: The README content as string
+        readme_lower: readme_text already lowercased, if the caller has it
 
     Returns:
         float: Score between 0.0 and 1.0 for safety/privacy considerations
@@ -203,48 +368,33 @@ def evaluate_safety_privacy(readme_text: Optional[str]) -> float:
     if not readme_text:
         return 0.0
 
-    score = 0.0
-    readme_lower = readme_text.lower()
+    score = 0  # tenths of a point
+    if readme_lower is None:
+        readme_lower = readme_text.lower()
 
     # Check for privacy considerations (0.4 points) - more comprehensive
-    privacy_keywords = [
-        'privacy', 'personal', 'pii', 'anonymized', 'anonymised',
-        'de-identified', 'confidential', 'sensitive', 'data protection',
-        'gdpr', 'ccpa', 'personal information', 'private data',
-        'data privacy'
-    ]
-
-    if any(keyword in readme_lower for keyword in privacy_keywords):
-        score += 0.4
+    if any(keyword in readme_lower for keyword in _PRIVACY_KEYWORDS):
+        score += 4
 
     # Check for safety considerations (0.3 points) - more comprehensive
-    safety_keywords = [
-        'safety', 'bias', 'fairness', 'ethical', 'responsible', 'harmful',
-        'content warning', 'disclaimer', 'risks', 'limitations',
-        'toxicity', 'hate speech', 'inappropriate', 'offensive content',
-        'safety guidelines', 'ethical considerations'
-    ]
-
-    if any(keyword in readme_lower for keyword in safety_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _SAFETY_KEYWORDS):
+        score += 3
 
     # Check for data source information (0.3 points) - more comprehensive
-    source_keywords = [
-        'source', 'origin', 'collected', 'gathered', 'obtained', 'derived',
-        'data source', 'origin of data', 'data collection', 'data gathering'
-    ]
-    if any(keyword in readme_lower for keyword in source_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _SOURCE_KEYWORDS):
+        score += 3
 
-    return min(1.0, score)
+    return score / 10
 
 
-def evaluate_curation_quality(readme_text: Optional[str]) -> float:
+def evaluate_curation_quality(readme_text: Optional[str],
+                              readme_lower: Optional[str] = None) -> float:
     """
     Evaluate curation and quality control measures mentioned.
 
     Args:
         readme_text: The README content as string
+        readme_lower: readme_text already lowercased, if the caller has it
 
     Returns:
         float: Score between 0.0 and 1.0 for curation quality
@@ -252,48 +402,33 @@ def evaluate_curation_quality(readme_text: Optional[str]) -> float:
     if not readme_text:
         return 0.0
 
-    score = 0.0
-    readme_lower = readme_text.lower()
+    score = 0  # tenths of a point
+    if readme_lower is None:
+        readme_lower = readme_text.lower()
 
     # Check for quality control measures (0.4 points) - with word boundaries
-    quality_patterns = [
-        r'\bquality\b', r'\bcurated\b', r'\bverified\b', r'\bvalidated\b',
-        r'\bchecked\b', r'\breviewed\b', r'\bfiltered\b', r'\bcleaned\b',
-        r'\bprocessed\b', r'\bpreprocessed\b', r'\bstandardized\b',
-        r'\bnormalized\b'
-    ]
-
-    for pattern in quality_patterns:
-        if re.search(pattern, readme_lower):
-            score += 0.4
-            break
+    if _QUALITY_RE.search(readme_lower):
+        score += 4
 
     # Check for version information (0.3 points) - more comprehensive
-    version_keywords = [
-        'version', 'v1', 'v2', 'v3', 'update', 'changelog', 'release',
-        'revision', 'iteration', 'edition', 'dataset version'
-    ]
-    if any(keyword in readme_lower for keyword in version_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _VERSION_KEYWORDS):
+        score += 3
 
     # Check for statistics or metrics (0.3 points) - more comprehensive
-    stats_keywords = [
-        'accuracy', 'precision', 'recall', 'f1', 'bleu', 'rouge',
-        'metric', 'statistic', 'benchmark', 'baseline', 'performance',
-        'evaluation', 'assessment', 'measurement'
-    ]
-    if any(keyword in readme_lower for keyword in stats_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _STATS_KEYWORDS):
+        score += 3
 
-    return min(1.0, score)
+    return score / 10
 
 
-def evaluate_reproducibility(readme_text: Optional[str]) -> float:
+def evaluate_reproducibility(readme_text: Optional[str],
+                             readme_lower: Optional[str] = None) -> float:
     """
     Evaluate reproducibility aspects of the dataset.
 
     Args:
         readme_text: The README content as string
+        readme_lower: readme_text already lowercased, if the caller has it
 
     Returns:
         float: Score between 0.0 and 1.0 for reproducibility
@@ -301,37 +436,23 @@ def evaluate_reproducibility(readme_text: Optional[str]) -> float:
     if not readme_text:
         return 0.0
 
-    score = 0.0
-    readme_lower = readme_text.lower()
+    score = 0  # tenths of a point
+    if readme_lower is None:
+        readme_lower = readme_text.lower()
 
     # Check for code availability (0.3 points) - more comprehensive
-    code_keywords = [
-        'code', 'github', 'repository', 'script', 'notebook', 'jupyter',
-        'source code', 'implementation', 'codebase', 'repository'
-    ]
-    if any(keyword in readme_lower for keyword in code_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _CODE_KEYWORDS):
+        score += 3
 
     # Check for environment setup (0.3 points) - more comprehensive
-    env_keywords = [
-        'environment', 'requirements', 'dependencies', 'install', 'setup',
-        'docker', 'conda', 'pip', 'package', 'library', 'framework',
-        'configuration'
-    ]
-    if any(keyword in readme_lower for keyword in env_keywords):
-        score += 0.3
+    if any(keyword in readme_lower for keyword in _ENV_KEYWORDS):
+        score += 3
 
     # Check for reproducibility instructions (0.4 points) - more comprehensive
-    repro_keywords = [
-        'reproduce', 'reproducibility', 'replicate', 'replication', 'recreate',
-        'step by step', 'instructions', 'tutorial', 'guide', 'experiment',
-        'reproduce results', 'replication study'
-    ]
+    if any(keyword in readme_lower for keyword in _REPRO_KEYWORDS):
+        score += 4
 
-    if any(keyword in readme_lower for keyword in repro_keywords):
-        score += 0.4
-
-    return min(1.0, score)
+    return score / 10
 
 
 def extract_dataset_identifier(dataset_link: str) -> str:
@@ -349,7 +470,6 @@ def extract_dataset_identifier(dataset_link: str) -> str:
 
     # Handle other dataset links - use domain + path
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(dataset_link)
         return f"{parsed.netloc}{parsed.path}".strip("/")
     except Exception:
@@ -362,67 +482,81 @@ def check_readme_for_known_datasets(readme: str,
     if not readme or not encountered_datasets:
         return False
 
-    readme_lower = readme.lower()
-
-    for dataset_id in encountered_datasets:
-        # Check for various forms of the dataset identifier
-        dataset_lower = dataset_id.lower()
-
-        # Direct mention
-        if dataset_lower in readme_lower:
-            return True
+    return mentions_known_resource(readme.lower(), encountered_datasets)
 
-        # Check for parts of the dataset name
-        dataset_parts = dataset_lower.replace("/", " ").replace(
-            "-", " ").replace("_", " ").split()
-        if len(dataset_parts) >= 2:
-            # Check if multiple parts are mentioned
-            parts_found = sum(1 for part in dataset_parts
-                              if len(part) > 3 and part in readme_lower)
-            if parts_found >= 2:
-                return True
 
-    return False
-
-
-def evaluate_dataset_documentation_hybrid(readme_text: Optional[str],
-                                          model_id: str,
-                                          use_ai: bool = True) -> float:
+def _combine_with_ai(deterministic_score: float,
+                     readme_text: Optional[str], model_id: str,
+                     use_ai: bool, aspect: str,
+                     deterministic_weight: float,
+                     ai_weight: float,
+                     ai_score: Optional[float] = None) -> float:
     """
-    Hybrid evaluation of dataset documentation quality using deterministic +
-    AI scoring.
+    Blend a deterministic score with the AI score for one aspect.
 
     Args:
+        deterministic_score: Score from the regex/keyword evaluator
         readme_text: The README content as string
         model_id: Model identifier for AI context
         use_ai: Whether to use AI enhancement
+        aspect: AI aspect to score ('documentation', 'safety', 'curation')
+        deterministic_weight: Weight of the deterministic score
+        ai_weight: Weight of the AI score
+        ai_score: AI score already fetched for this aspect, if any
 
     Returns:
-        float: Score between 0.0 and 1.0 for documentation quality
+        float: Score between 0.0 and 1.0
     """
-    # Get deterministic score
-    deterministic_score = evaluate_dataset_documentation(readme_text)
-
     # If no AI requested or no text, return deterministic score
     if not use_ai or not readme_text:
         return deterministic_score
 
-    # Get AI score
-    ai_score = _get_ai_score(readme_text, model_id, 'documentation')
+    # Get AI score, unless the caller already has it
+    if ai_score is None:
+        ai_score = _get_ai_score(readme_text, model_id, aspect)
 
     # If AI failed (returned 0.0), use deterministic only
     if ai_score == 0.0:
         return deterministic_score
 
+    # Both scores are in [0, 1] and the weights sum to 1, so the blend is
+    # too; no clamp needed
+    return (deterministic_score * deterministic_weight) + (
+        ai_score * ai_weight)
+
+
+def evaluate_dataset_documentation_hybrid(
+        readme_text: Optional[str], model_id: str, use_ai: bool = True,
+        readme_lower: Optional[str] = None,
+        ai_score: Optional[float] = None) -> float:
+    """
+    Hybrid evaluation of dataset documentation quality using deterministic +
+    AI scoring.
+
+    Args:
+        readme_text: The README content as string
+        model_id: Model identifier for AI context
+        use_ai: Whether to use AI enhancement
+        readme_lower: readme_text already lowercased, if the caller has it
+        ai_score: AI score already fetched for this aspect, if any
+
+    Returns:
+        float: Score between 0.0 and 1.0 for documentation quality
+    """
+    # Get deterministic score
+    deterministic_score = evaluate_dataset_documentation(readme_text,
+                                                         readme_lower)
+
     # Weighted combination: 70% deterministic (reliable baseline),
     # 30% AI (enhanced understanding)
-    hybrid_score = (deterministic_score * 0.7) + (ai_score * 0.3)
-    return min(1.0, hybrid_score)
+    return _combine_with_ai(deterministic_score, readme_text, model_id,
+                            use_ai, 'documentation', 0.7, 0.3, ai_score)
 
 
-def evaluate_safety_privacy_hybrid(readme_text: Optional[str],
-                                   model_id: str,
-                                   use_ai: bool = True) -> float:
+def evaluate_safety_privacy_hybrid(
+        readme_text: Optional[str], model_id: str, use_ai: bool = True,
+        readme_lower: Optional[str] = None,
+        ai_score: Optional[float] = None) -> float:
     """
     Hybrid evaluation of safety and privacy considerations using
     deterministic + AI scoring.
@@ -431,33 +565,25 @@ def evaluate_safety_privacy_hybrid(readme_text: Optional[str],
         readme_text: The README content as string
         model_id: Model identifier for AI context
         use_ai: Whether to use AI enhancement
+        readme_lower: readme_text already lowercased, if the caller has it
+        ai_score: AI score already fetched for this aspect, if any
 
     Returns:
         float: Score between 0.0 and 1.0 for safety/privacy considerations
     """
     # Get deterministic score
-    deterministic_score = evaluate_safety_privacy(readme_text)
-
-    # If no AI requested or no text, return deterministic score
-    if not use_ai or not readme_text:
-        return deterministic_score
-
-    # Get AI score
-    ai_score = _get_ai_score(readme_text, model_id, 'safety')
-
-    # If AI failed (returned 0.0), use deterministic only
-    if ai_score == 0.0:
-        return deterministic_score
+    deterministic_score = evaluate_safety_privacy(readme_text, readme_lower)
 
     # Weighted combination: 60% deterministic, 40% AI
     # (AI is better at nuanced safety assessment)
-    hybrid_score = (deterministic_score * 0.6) + (ai_score * 0.4)
-    return min(1.0, hybrid_score)
+    return _combine_with_ai(deterministic_score, readme_text, model_id,
+                            use_ai, 'safety', 0.6, 0.4, ai_score)
 
 
-def evaluate_curation_quality_hybrid(readme_text: Optional[str],
-                                     model_id: str,
-                                     use_ai: bool = True) -> float:
+def evaluate_curation_quality_hybrid(
+        readme_text: Optional[str], model_id: str, use_ai: bool = True,
+        readme_lower: Optional[str] = None,
+        ai_score: Optional[float] = None) -> float:
     """
     Hybrid evaluation of curation and quality control measures using
     deterministic + AI scoring.
@@ -466,28 +592,19 @@ def evaluate_curation_quality_hybrid(readme_text: Optional[str],
         readme_text: The README content as string
         model_id: Model identifier for AI context
         use_ai: Whether to use AI enhancement
+        readme_lower: readme_text already lowercased, if the caller has it
+        ai_score: AI score already fetched for this aspect, if any
 
     Returns:
         float: Score between 0.0 and 1.0 for curation quality
     """
     # Get deterministic score
-    deterministic_score = evaluate_curation_quality(readme_text)
-
-    # If no AI requested or no text, return deterministic score
-    if not use_ai or not readme_text:
-        return deterministic_score
-
-    # Get AI score
-    ai_score = _get_ai_score(readme_text, model_id, 'curation')
-
-    # If AI failed (returned 0.0), use deterministic only
-    if ai_score == 0.0:
-        return deterministic_score
+    deterministic_score = evaluate_curation_quality(readme_text, readme_lower)
 
     # Weighted combination: 65% deterministic, 35% AI
     # (AI can better assess quality descriptions)
-    hybrid_score = (deterministic_score * 0.65) + (ai_score * 0.35)
-    return min(1.0, hybrid_score)
+    return _combine_with_ai(deterministic_score, readme_text, model_id,
+                            use_ai, 'curation', 0.65, 0.35, ai_score)
 
 
 def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
@@ -515,7 +632,7 @@ def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
         Tuple[float, float]: (score, elapsed_time) where score is between
         0.0 and 1.0
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     if encountered_datasets is None:
         encountered_datasets = set()
@@ -526,6 +643,7 @@ def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
 
     # If no external dataset link, check README for references to known
     # datasets
+    readme = None
     if not has_external_dataset:
         readme = fetch_readme(model_id)
         if readme and encountered_datasets:
@@ -535,7 +653,7 @@ def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
 
     # If no dataset is available, return 0.0
     if not dataset_available:
-        end_time = time.time()
+        end_time = time.perf_counter()
         return (0.0, end_time - start_time)
 
     # Add external dataset to encountered set for future models
@@ -544,22 +662,36 @@ def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
         if dataset_id:
             encountered_datasets.add(dataset_id)
 
-    # Fetch README
-    readme = fetch_readme(model_id)
+    # Fetch README, unless the known-dataset check already did
+    if readme is None:
+        readme = fetch_readme(model_id)
     if not readme:
-        end_time = time.time()
+        end_time = time.perf_counter()
         return (0.0, end_time - start_time)
 
+    # Score only the leading part of very long READMEs, then lowercase once
+    # and share it across all evaluators
+    readme = readme[:MAX_README_CHARS]
+    readme_lower = readme.lower()
+
+    # One LLM call rates all three AI-enhanced aspects
+    ai_scores = _get_ai_scores(readme, model_id) if use_ai else {}
+
     # Calculate all 5 dataset quality scores
     # Use hybrid scoring for documentation, safety/privacy, and curation
     # Keep deterministic for license clarity and reproducibility
     # (regex works well for these)
-    doc_score = evaluate_dataset_documentation_hybrid(readme, model_id, use_ai)
-    license_score = evaluate_license_clarity(readme)  # Keep deterministic
-    safety_score = evaluate_safety_privacy_hybrid(readme, model_id, use_ai)
-    curation_score = evaluate_curation_quality_hybrid(readme, model_id,
-                                                      use_ai)
-    repro_score = evaluate_reproducibility(readme)  # Keep deterministic
+    doc_score = evaluate_dataset_documentation_hybrid(
+        readme, model_id, use_ai, readme_lower,
+        ai_scores.get('documentation'))
+    # Keep deterministic
+    license_score = evaluate_license_clarity(readme, readme_lower)
+    safety_score = evaluate_safety_privacy_hybrid(
+        readme, model_id, use_ai, readme_lower, ai_scores.get('safety'))
+    curation_score = evaluate_curation_quality_hybrid(
+        readme, model_id, use_ai, readme_lower, ai_scores.get('curation'))
+    # Keep deterministic
+    repro_score = evaluate_reproducibility(readme, readme_lower)
 
     # Equal weighted combination (0.2 each for the 5 criteria)
     final_score = (
@@ -570,7 +702,7 @@ def dataset_quality_sub_score(model_id: str, dataset_link: str = "",
         repro_score * 0.2
     )
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     return (final_score, end_time - start_time)
 
 
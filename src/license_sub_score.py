@@ -1,9 +1,14 @@
 import os
 import re
 import time
+from functools import lru_cache
 from typing import Optional
 
-import requests
+# Relative when loaded as src.*, flat when src/ itself is on sys.path
+try:
+    from .hugging_face_api import SESSION
+except ImportError:
+    from hugging_face_api import SESSION  # type: ignore[no-redef]
 
 # Define which licenses are compatible with LGPL v2.1
 # This list is from two websites:
@@ -15,20 +20,42 @@ COMPATIBLE_LICENSES = {
     'unlicense', 'zlib', 'apache-2.0',
 }
 
+# COMPATIBLE_LICENSES in the same normalized form as the README license
+# string, computed once at import instead of on every score
+_NORMALIZED_COMPATIBLE = tuple(
+    comp.replace("-", "").replace(" ", "") for comp in COMPATIBLE_LICENSES)
+
+# License patterns compiled once at import rather than on every README
+_YAML_LICENSE_RE = re.compile(r"^---[\s\S]*?license:\s*([^\n]+)",
+                              re.IGNORECASE | re.MULTILINE)
+_LICENSE_HEADING_RE = re.compile(r"^#+\s*License\s*$", re.IGNORECASE)
+
+# Upper bound on cached READMEs; a batch run touches each model once per
+# metric, so this comfortably covers any realistic input file.
+README_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=README_CACHE_SIZE)
+def _download_readme(model_id: str) -> str:
+    # Construct raw README URL from model ID. Failures raise, so only
+    # successful downloads end up in the cache.
+    raw_url = f"https://huggingface.co/{model_id}/resolve/main/README.md"
+    response = SESSION.get(raw_url, timeout=10)
+    response.raise_for_status()
+    return str(response.text)
+
 
 """
 Fetch the README.md text from a Hugging Face model repository. Uses the
 model ID (e.g., "baidu/ERNIE-4.5-21B-A3B-Thinking").
+Every metric reads the same README, so successful fetches are memoized per
+model ID and repeat calls skip the HTTP round trip.
 """
 
 
 def fetch_readme(model_id: str) -> Optional[str]:
-    # Construct raw README URL from model ID
-    raw_url = f"https://huggingface.co/{model_id}/resolve/main/README.md"
     try:
-        response = requests.get(raw_url, timeout=10)
-        response.raise_for_status()
-        return str(response.text)
+        return _download_readme(model_id)
     except Exception as e:
         if int(os.getenv("LOG_LEVEL", "0")) > 0:
             print(f"[ERROR] Failed to fetch README: {e}")
@@ -43,15 +70,15 @@ Handles both YAML front matter and '## License' sections.
 
 def extract_license(readme_text: str) -> Optional[str]:
     # Case 1: YAML front matter
-    yaml_match = re.search(r"^---[\s\S]*?license:\s*([^\n]+)",
-                           readme_text, re.IGNORECASE | re.MULTILINE)
+    yaml_match = _YAML_LICENSE_RE.search(readme_text)
     if yaml_match:
         return yaml_match.group(1).strip().lower()
 
-    # Case 2: Markdown heading '## License'
+    # Case 2: Markdown heading '## License'. Lines without a '#' cannot be
+    # headings, so they skip the strip and regex match.
     lines = readme_text.splitlines()
     for i, line in enumerate(lines):
-        if re.match(r"^#+\s*License\s*$", line.strip(), re.IGNORECASE):
+        if '#' in line and _LICENSE_HEADING_RE.match(line.strip()):
             for j in range(i + 1, len(lines)):
                 if lines[j].strip():
                     return lines[j].strip().lower()
@@ -68,26 +95,26 @@ Input: model_id (e.g., "baidu/ERNIE-4.5-21B-A3B-Thinking")
 
 
 def license_sub_score(model_id: str) -> tuple[int, float]:
-    start_time = time.time()
+    start_time = time.perf_counter()
     readme = fetch_readme(model_id)
     if not readme:
-        end_time = time.time()
+        end_time = time.perf_counter()
         return (0, end_time - start_time)
 
     license_str = extract_license(readme)
     if not license_str:
-        end_time = time.time()
+        end_time = time.perf_counter()
         return (0, end_time - start_time)
 
     # Normalize
     normalized = license_str.lower().replace(
         " ", "").replace("-", "").replace("license", "")
 
-    for comp in COMPATIBLE_LICENSES:
-        if comp.replace("-", "").replace(" ", "") in normalized:
-            end_time = time.time()
+    for comp in _NORMALIZED_COMPATIBLE:
+        if comp in normalized:
+            end_time = time.perf_counter()
             return (1, end_time - start_time)
-    end_time = time.time()
+    end_time = time.perf_counter()
     return (0, end_time - start_time)
 
 
@@ -9,6 +9,7 @@ This module provides a comprehensive logging system with:
 - Structured logging with correlation IDs
 """
 
+import json
 import logging
 import logging.handlers
 import os
@@ -28,6 +29,29 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Correlation ID stamped on every log record once one has been set. The
+# record factory is installed only once and reads the current ID, so
+# changing the ID does not wrap the global factory again.
+_correlation_id = ""
+_record_factory_installed = False
+
+
+def _set_correlation_id(correlation_id: str) -> None:
+    """Set the correlation ID, installing the record factory on first use."""
+    global _correlation_id, _record_factory_installed
+    _correlation_id = correlation_id
+    if _record_factory_installed:
+        return
+
+    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = old_factory(*args, **kwargs)
+        record.correlation_id = _correlation_id
+        return record
+    old_factory = logging.getLogRecordFactory()
+    logging.setLogRecordFactory(record_factory)
+    _record_factory_installed = True
+
+
 class LoggingConfig:
     """Centralized logging configuration manager."""
 
@@ -117,13 +141,7 @@ class LoggingConfig:
 
         # Add correlation ID to log records if provided
         if correlation_id:
-
-            def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
-                record = old_factory(*args, **kwargs)
-                record.correlation_id = correlation_id
-                return record
-            old_factory = logging.getLogRecordFactory()
-            logging.setLogRecordFactory(record_factory)
+            _set_correlation_id(correlation_id)
 
         return logger
 
@@ -151,7 +169,7 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return str(log_entry)
+        return json.dumps(log_entry)
 
 
 class LoggerManager:
@@ -182,13 +200,7 @@ class LoggerManager:
 
     def set_correlation_id(self, correlation_id: str) -> None:
         """Set correlation ID for all future log records."""
-
-        def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
-            record = old_factory(*args, **kwargs)
-            record.correlation_id = correlation_id
-            return record
-        old_factory = logging.getLogRecordFactory()
-        logging.setLogRecordFactory(record_factory)
+        _set_correlation_id(correlation_id)
 
 
 # Global logger manager instance
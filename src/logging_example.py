@@ -24,9 +24,10 @@ def example_function() -> None:
     logger.critical("This is a critical message - serious error")
 
     # Performance logging
-    start_time = time.time()
+    start_time = time.perf_counter()
     time.sleep(0.1)  # Simulate work
-    log_performance("example_function", time.time() - start_time, logger)
+    log_performance(
+        "example_function", time.perf_counter() - start_time, logger)
 
     # Error logging with context
     try:
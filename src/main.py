@@ -3,20 +3,65 @@
 
 import csv
 import json
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 # Import scoring modules
 import available_dataset_code_score
 import bus_factor
 import dataset_quality_sub_score
+import hugging_face_api
 import license_sub_score
 import net_score_calculator
 import performance_claims_sub_score
 import ramp_up_sub_score
 
+# Every metric is an independent network-bound call, so they are issued
+# together on a small thread pool instead of one after another. The shared
+# HTTP session keeps one pooled connection per worker.
+METRIC_WORKERS = hugging_face_api.MAX_PARALLEL_REQUESTS
+
+# Pages the metrics share, each memoized by its module. They are fetched
+# once up front so concurrent metrics hit the cache instead of all missing
+# it at once and downloading the same page again.
+SHARED_FETCHES = (
+    license_sub_score.fetch_readme,
+    hugging_face_api.get_model_info,
+    bus_factor.get_huggingface_contributors,
+)
+
+
+# Optional JSON file that carries encountered datasets/code between runs,
+# so later batches can credit references to resources seen earlier
+KNOWN_RESOURCES_ENV = "KNOWN_RESOURCES_FILE"
+
+
+def load_known_resources(path: str) -> Tuple[set[str], set[str]]:
+    """Load encountered dataset and code IDs saved by a previous run."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return set(data.get("datasets", [])), set(data.get("code", []))
+    except (OSError, ValueError, AttributeError, TypeError):
+        # Missing or unreadable index: start from nothing
+        return set(), set()
+
+
+def save_known_resources(path: str, encountered_datasets: set[str],
+                         encountered_code: set[str]) -> None:
+    """Save encountered dataset and code IDs for the next run."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"datasets": sorted(encountered_datasets),
+                       "code": sorted(encountered_code)}, f)
+    except OSError as e:
+        print(f"Error saving known resources to '{path}': {e}",
+              file=sys.stderr)
+
 
 def extract_model_name(model_url: str) -> str:
     """Extract model name from Hugging Face URL."""
@@ -81,11 +126,37 @@ def calculate_all_scores(code_link: str, dataset_link: str,
         "code_quality": 0.0,
         "code_quality_latency": 0
     }
+    net_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=METRIC_WORKERS) as executor:
+        # Fill the shared caches first, fetching the pages side by side
+        prefetches = [executor.submit(fetch, model_name)
+                      for fetch in SHARED_FETCHES]
+        for prefetch in prefetches:
+            prefetch.result()
+        # Start every metric up front; each try block below waits on its
+        # result
+        license_future = executor.submit(
+            license_sub_score.license_sub_score, model_name)
+        bus_future = executor.submit(bus_factor.bus_factor_score, model_name)
+        ramp_future = executor.submit(
+            ramp_up_sub_score.ramp_up_time_score, model_name)
+        perf_future = executor.submit(
+            performance_claims_sub_score.performance_claims_sub_score,
+            model_name)
+        dataset_future = executor.submit(
+            dataset_quality_sub_score.dataset_quality_sub_score,
+            model_name, dataset_link, encountered_datasets)
+        code_future = executor.submit(
+            available_dataset_code_score.available_dataset_code_score,
+            model_name, code_link, dataset_link, encountered_datasets,
+            encountered_code)
+    # Results that succeed are passed on to the net score below
+    metric_results: Dict[str, Tuple[float, float]] = {}
     # Calculate each score with timing
     try:
         # License Score
-        license_score, license_latency = license_sub_score.license_sub_score(
-            model_name)
+        license_score, license_latency = license_future.result()
+        metric_results["license"] = (license_score, license_latency)
         result["license"] = license_score
         result["license_latency"] = int(license_latency * 1000)
     except Exception as e:
@@ -93,7 +164,8 @@ def calculate_all_scores(code_link: str, dataset_link: str,
               file=sys.stderr)
     try:
         # Bus Factor Score
-        bus_score_raw, bus_latency = bus_factor.bus_factor_score(model_name)
+        bus_score_raw, bus_latency = bus_future.result()
+        metric_results["bus_factor"] = (bus_score_raw, bus_latency)
         # Normalize bus factor: cap at 20 contributors, then scale to 0-1
         bus_score_normalized = min(bus_score_raw / 20.0, 1.0)
         result["bus_factor"] = bus_score_normalized
@@ -103,8 +175,8 @@ def calculate_all_scores(code_link: str, dataset_link: str,
               file=sys.stderr)
     try:
         # Ramp Up Score
-        ramp_score, ramp_latency = ramp_up_sub_score.ramp_up_time_score(
-            model_name)
+        ramp_score, ramp_latency = ramp_future.result()
+        metric_results["ramp_up_time"] = (ramp_score, ramp_latency)
         result["ramp_up_time"] = ramp_score
         result["ramp_up_time_latency"] = int(ramp_latency * 1000)
     except Exception as e:
@@ -112,9 +184,8 @@ def calculate_all_scores(code_link: str, dataset_link: str,
               file=sys.stderr)
     try:
         # Performance Claims Score
-        perf_score, perf_latency = (
-            performance_claims_sub_score.performance_claims_sub_score(
-                model_name))
+        perf_score, perf_latency = perf_future.result()
+        metric_results["performance_claims"] = (perf_score, perf_latency)
         result["performance_claims"] = perf_score
         result["performance_claims_latency"] = int(perf_latency * 1000)
     except Exception as e:
@@ -122,9 +193,8 @@ def calculate_all_scores(code_link: str, dataset_link: str,
               file=sys.stderr)
     try:
         # Dataset Quality Score
-        dataset_score, dataset_latency = (
-            dataset_quality_sub_score.dataset_quality_sub_score(
-                model_name, dataset_link, encountered_datasets))
+        dataset_score, dataset_latency = dataset_future.result()
+        metric_results["dataset_quality"] = (dataset_score, dataset_latency)
         result["dataset_quality"] = dataset_score
         result["dataset_quality_latency"] = int(dataset_latency * 1000)
     except Exception as e:
@@ -132,10 +202,8 @@ def calculate_all_scores(code_link: str, dataset_link: str,
               file=sys.stderr)
     try:
         # Available Dataset Code Score
-        code_score, code_latency = (
-            available_dataset_code_score.available_dataset_code_score(
-                model_name, code_link, dataset_link, encountered_datasets,
-                encountered_code))
+        code_score, code_latency = code_future.result()
+        metric_results["dataset_and_code_score"] = (code_score, code_latency)
         result["code_quality"] = code_score
         result["code_quality_latency"] = int(code_latency * 1000)
         result["dataset_and_code_score"] = code_score  # Same as code_quality
@@ -144,10 +212,10 @@ def calculate_all_scores(code_link: str, dataset_link: str,
         print(f"Error calculating code quality for {model_name}: {e}",
               file=sys.stderr)
     try:
-        # Net Score (calculated from all other scores)
-        start_time = time.time()
+        # Net Score (combined from the scores above)
         net_score_result = net_score_calculator.calculate_net_score(
-            model_name)
+            model_name, metric_results)
+        net_latency = time.perf_counter() - net_start
         # Extract just the numeric score from the result
         if (isinstance(net_score_result, dict) and
                 "net_score" in net_score_result):
@@ -155,8 +223,7 @@ def calculate_all_scores(code_link: str, dataset_link: str,
         else:
             result["net_score"] = (float(net_score_result)
                                    if net_score_result else 0.0)
-        result["net_score_latency"] = int(
-            (time.time() - start_time) * 1000)
+        result["net_score_latency"] = int(net_latency * 1000)
     except Exception as e:
         print(f"Error calculating net score for {model_name}: {e}",
               file=sys.stderr)
@@ -199,9 +266,14 @@ def main() -> int:
         return 1
     input_file = sys.argv[1]
 
-    # Track encountered datasets and code across all models
+    # Track encountered datasets and code across all models (and across
+    # runs when KNOWN_RESOURCES_FILE is set)
+    known_resources_file = os.getenv(KNOWN_RESOURCES_ENV)
     encountered_datasets: set[str] = set()
     encountered_code: set[str] = set()
+    if known_resources_file:
+        encountered_datasets, encountered_code = load_known_resources(
+            known_resources_file)
 
     try:
         with open(input_file, 'r', encoding='utf-8') as f:
@@ -236,6 +308,9 @@ def main() -> int:
                         encountered_datasets, encountered_code)
                 # Output clean JSON result (no extra whitespace)
                 print(json.dumps(result, separators=(',', ':')))
+        if known_resources_file:
+            save_known_resources(known_resources_file, encountered_datasets,
+                                 encountered_code)
         # If we get here, all URLs were processed successfully
         return 0
     except FileNotFoundError:
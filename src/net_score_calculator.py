@@ -11,6 +11,7 @@ Missing functions (Size, CodeQuality) are set to 0.5 as defaults.
 """
 
 import time
+from typing import Callable, Dict, Optional, Tuple
 
 from available_dataset_code_score import available_dataset_code_score
 from bus_factor import bus_factor_score
@@ -21,17 +22,34 @@ from ramp_up_sub_score import ramp_up_time_score
 from schema import ProjectMetadata
 
 
-def calculate_net_score(model_id: str) -> ProjectMetadata:
+def _metric_result(metric_results: Optional[Dict[str, Tuple[float, float]]],
+                   name: str, metric: Callable[[str], Tuple[float, float]],
+                   model_id: str) -> Tuple[float, float]:
+    """Return the caller's (score, latency) for a metric, or compute it."""
+    if metric_results and name in metric_results:
+        return metric_results[name]
+    return metric(model_id)
+
+
+def calculate_net_score(
+    model_id: str,
+    metric_results: Optional[Dict[str, Tuple[float, float]]] = None
+) -> ProjectMetadata:
     """
     Calculate the overall NetScore for a model using all available metrics.
 
     Args:
         model_id: Hugging Face model ID (e.g., "microsoft/DialoGPT-medium")
+        metric_results: (score, latency) pairs the caller already computed,
+            keyed by ProjectMetadata field ("license", "ramp_up_time",
+            "bus_factor" (raw contributor count), "dataset_and_code_score",
+            "dataset_quality", "performance_claims"). Metrics not given
+            are computed here.
 
     Returns:
         ProjectMetadata object containing all scores and NetScore
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Calculate individual scores
     print(f"Calculating scores for model: {model_id}")
@@ -42,30 +60,35 @@ def calculate_net_score(model_id: str) -> ProjectMetadata:
     print(f"Size Score: {size_score:.3f} (default - not implemented)")
 
     # License Score (0.2 weight)
-    license_score, license_latency = license_sub_score(model_id)
+    license_score, license_latency = _metric_result(
+        metric_results, "license", license_sub_score, model_id)
     print(f"License Score: {license_score:.3f} "
           f"(latency: {license_latency:.3f}s)")
 
     # Ramp Up Time Score (0.2 weight)
-    ramp_up_score, ramp_up_latency = ramp_up_time_score(model_id)
+    ramp_up_score, ramp_up_latency = _metric_result(
+        metric_results, "ramp_up_time", ramp_up_time_score, model_id)
     print(f"Ramp Up Score: {ramp_up_score:.3f} "
           f"(latency: {ramp_up_latency:.3f}s)")
 
     # Bus Factor Score (0.05 weight) - normalize to 0-1 range
-    bus_factor_raw, bus_factor_latency = bus_factor_score(model_id)
+    bus_factor_raw, bus_factor_latency = _metric_result(
+        metric_results, "bus_factor", bus_factor_score, model_id)
     # Normalize bus factor: cap at 20 contributors, then scale to 0-1
     bus_factor = min(bus_factor_raw / 20.0, 1.0)
     print(f"Bus Factor: {bus_factor:.3f} (raw: {bus_factor_raw}) "
           f"(latency: {bus_factor_latency:.3f}s)")
 
     # Dataset & Code Score (0.15 weight)
-    dataset_code_score, dataset_code_latency = available_dataset_code_score(
-        model_id)
+    dataset_code_score, dataset_code_latency = _metric_result(
+        metric_results, "dataset_and_code_score",
+        available_dataset_code_score, model_id)
     print(f"Dataset & Code Score: {dataset_code_score:.3f} "
           f"(latency: {dataset_code_latency:.3f}s)")
 
     # Dataset Quality Score (0.15 weight)
-    dataset_quality, dataset_quality_latency = dataset_quality_sub_score(
+    dataset_quality, dataset_quality_latency = _metric_result(
+        metric_results, "dataset_quality", dataset_quality_sub_score,
         model_id)
     print(f"Dataset Quality Score: {dataset_quality:.3f} "
           f"(latency: {dataset_quality_latency:.3f}s)")
@@ -77,8 +100,9 @@ def calculate_net_score(model_id: str) -> ProjectMetadata:
           f"(default - not implemented)")
 
     # Performance Claims Score (0.1 weight)
-    performance_claims, performance_claims_latency = (
-        performance_claims_sub_score(model_id))
+    performance_claims, performance_claims_latency = _metric_result(
+        metric_results, "performance_claims",
+        performance_claims_sub_score, model_id)
     print(f"Performance Claims Score: {performance_claims:.3f} "
           f"(latency: {performance_claims_latency:.3f}s)")
 
@@ -94,7 +118,7 @@ def calculate_net_score(model_id: str) -> ProjectMetadata:
         0.1 * performance_claims
     )
 
-    total_latency = int((time.time() - start_time) * 1000)
+    total_latency = int((time.perf_counter() - start_time) * 1000)
 
     print(f"\nNetScore: {net_score:.3f}")
     print(f"Total calculation time: {total_latency}ms")
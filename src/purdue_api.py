@@ -83,25 +83,14 @@ class PurdueGenAI:
                     response_data = json.loads(
                         response.read().decode('utf-8')
                     )
-                    # Type-safe access to nested dictionary
-                    if not isinstance(response_data, dict):
+                    # A single nested lookup validates the whole response
+                    # shape; any missing key or wrong type lands here.
+                    try:
+                        content = (
+                            response_data["choices"][0]["message"]["content"]
+                        )
+                    except (KeyError, IndexError, TypeError):
                         raise Exception("Invalid response format from API")
-                    if "choices" not in response_data:
-                        raise Exception("Invalid response format from API")
-                    if not isinstance(response_data["choices"], list):
-                        raise Exception("Invalid response format from API")
-                    if len(response_data["choices"]) == 0:
-                        raise Exception("Invalid response format from API")
-                    if not isinstance(response_data["choices"][0], dict):
-                        raise Exception("Invalid response format from API")
-                    if "message" not in response_data["choices"][0]:
-                        raise Exception("Invalid response format from API")
-                    message = response_data["choices"][0]["message"]
-                    if not isinstance(message, dict):
-                        raise Exception("Invalid response format from API")
-                    if "content" not in message:
-                        raise Exception("Invalid response format from API")
-                    content = message["content"]
                     return str(content)
                 else:
                     error_text = response.read().decode('utf-8')
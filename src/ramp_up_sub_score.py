@@ -27,13 +27,13 @@ def ramp_up_time_score(model_id: str) -> Tuple[float, float]:
     - Coding example in README (looks for '```' or 'example' keyword)
     Returns (score, elapsed_time)
     """
-    start = time.time()
+    start = time.perf_counter()
     score = 0.0
 
     # Get model info from Hugging Face API
     info, _ = get_model_info(model_id)
     if info is None:
-        return 0.0, time.time() - start
+        return 0.0, time.perf_counter() - start
 
     # 1. Downloads
     score += normalize_sigmoid(value=info.get("downloads", 0),
@@ -54,7 +54,7 @@ def ramp_up_time_score(model_id: str) -> Tuple[float, float]:
 
     # Normalize (max score is 4)
     normalized = score / 4
-    return normalized, time.time() - start
+    return normalized, time.perf_counter() - start
 
 
 if __name__ == "__main__":
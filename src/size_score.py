@@ -234,7 +234,7 @@ def size_score(model_url: str) -> Tuple[Dict[str, float], float]:
         {'raspberry_pi': 0.0, 'jetson_nano': 0.0, 'desktop_gpu': 1.0,
          'high_end_gpu': 1.0}
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         logger.info(f"Calculating size score for: {model_url}")
@@ -243,27 +243,27 @@ def size_score(model_url: str) -> Tuple[Dict[str, float], float]:
         readme_text = fetch_readme(model_url)
         if not readme_text:
             logger.warning(f"No README content found for {model_url}")
-            end_time = time.time()
+            end_time = time.perf_counter()
             return {}, end_time - start_time
 
         # Extract memory sizes from README
         memory_sizes = extract_memory_sizes(readme_text)
         if not memory_sizes:
             logger.warning(f"No memory sizes found in README for {model_url}")
-            end_time = time.time()
+            end_time = time.perf_counter()
             return {}, end_time - start_time
 
         # Find smallest model size
         smallest_size = find_smallest_model_size(memory_sizes)
         if smallest_size is None:
             logger.warning(f"Could not determine model size for {model_url}")
-            end_time = time.time()
+            end_time = time.perf_counter()
             return {}, end_time - start_time
 
         # Calculate scores against all benchmarks
         size_scores = calculate_size_scores(smallest_size)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         latency = end_time - start_time
 
         logger.info(f"Size score calculation completed in {latency:.3f}s")
@@ -272,7 +272,7 @@ def size_score(model_url: str) -> Tuple[Dict[str, float], float]:
     except Exception as e:
         log_error_with_context(
             e, f"Error calculating size score for {model_url}", logger)
-        end_time = time.time()
+        end_time = time.perf_counter()
         return {}, end_time - start_time
 
 
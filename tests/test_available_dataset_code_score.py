@@ -473,6 +473,31 @@ class TestAvailableDatasetCodeScore(unittest.TestCase):
             self.assertEqual(score, 0.0)
             self.assertGreaterEqual(elapsed, 0)
 
+    def test_score_known_code_reference(self) -> None:
+        """Test that a README naming previously seen code counts as code."""
+        with patch('available_dataset_code_score.fetch_readme') as mock_fetch:
+            mock_fetch.return_value = README_DATASET_ONLY_CSV + (
+                "Built on google-research/bert.")
+            score, _ = available_dataset_code_score(
+                "test-model", encountered_datasets=set(),
+                encountered_code={"google-research/bert"})
+            self.assertEqual(score, 1.0)
+
+    def test_known_scan_skipped_for_detected_kind(self) -> None:
+        """Test that known datasets are not scanned once a link is found."""
+        with patch('available_dataset_code_score.fetch_readme') as \
+             mock_fetch, \
+             patch('available_dataset_code_score.'
+                   'check_readme_for_known_resources') as mock_check:
+            mock_fetch.return_value = README_DATASET_ONLY_CSV
+            mock_check.return_value = (False, False)
+            available_dataset_code_score(
+                "test-model", encountered_datasets={"some/dataset"},
+                encountered_code={"some/code"})
+            _, datasets_arg, code_arg = mock_check.call_args[0]
+            self.assertEqual(datasets_arg, set())
+            self.assertEqual(code_arg, {"some/code"})
+
 
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and special scenarios."""
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 # Add the src directory to the path so we can import bus_factor
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import bus_factor  # noqa: E402
 from bus_factor import bus_factor_score  # noqa: E402
 from bus_factor import get_huggingface_contributors  # noqa: E402
 
@@ -16,6 +17,8 @@ class TestBusFactorScore(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures before each test method."""
+        # Tests reuse model IDs with different mocked pages
+        bus_factor._count_contributors.cache_clear()
         self.test_models = [
             "moonshotai/Kimi-K2-Instruct-0905",
             "microsoft/CodeBERT-base",
@@ -191,10 +194,11 @@ class TestBusFactorScore(unittest.TestCase):
         ]
 
         for html, expected in html_cases:
-            with patch("requests.get") as mock_get:
+            bus_factor._count_contributors.cache_clear()
+            with patch("requests.Session.get") as mock_get:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
-                mock_response.text = html
+                mock_response.iter_content.return_value = [html]
                 mock_get.return_value = mock_response
 
                 result = get_huggingface_contributors("fake/model")
@@ -202,16 +206,17 @@ class TestBusFactorScore(unittest.TestCase):
 
     def test_requests_exception(self) -> None:
         """Simulate a requests exception and ensure 0 is returned."""
-        with patch("requests.get", side_effect=Exception("Network error")):
+        with patch("requests.Session.get",
+                   side_effect=Exception("Network error")):
             result = get_huggingface_contributors("any/model")
             self.assertEqual(result, 0)
 
     def test_no_match_returns_zero(self) -> None:
         """Ensure no regex match returns 0 contributors."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.text = "no contributors here"
+            mock_response.iter_content.return_value = ["no contributors here"]
             mock_get.return_value = mock_response
 
             result = get_huggingface_contributors("fake/model")
@@ -219,10 +224,10 @@ class TestBusFactorScore(unittest.TestCase):
 
     def test_non_200_status_code(self) -> None:
         """Ensure non-200 status code returns 0 contributors."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
-            mock_response.text = "Not Found"
+            mock_response.iter_content.return_value = ["Not Found"]
             mock_get.return_value = mock_response
 
             result = get_huggingface_contributors("fake/model")
@@ -230,15 +235,54 @@ class TestBusFactorScore(unittest.TestCase):
 
     def test_invalid_number_match(self) -> None:
         """Ensure invalid number strings are ignored safely."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.text = '<span>"contributors": notanumber</span>'
+            mock_response.iter_content.return_value = [
+                '<span>"contributors": notanumber</span>']
             mock_get.return_value = mock_response
 
             result = get_huggingface_contributors("fake/model")
             self.assertEqual(result, 0)
 
+    def test_contributors_cached(self) -> None:
+        """Ensure a parsed count is reused without refetching the page."""
+        with patch("requests.Session.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.iter_content.return_value = [
+                "<span>9 contributors</span>"]
+            mock_get.return_value = mock_response
+
+            self.assertEqual(get_huggingface_contributors("fake/model"), 9)
+            self.assertEqual(get_huggingface_contributors("fake/model"), 9)
+            mock_get.assert_called_once()
+
+    def test_failed_lookup_not_cached(self) -> None:
+        """Ensure a non-200 page is retried on the next call."""
+        with patch("requests.Session.get") as mock_get:
+            not_found = MagicMock(status_code=404)
+            found = MagicMock(status_code=200)
+            found.iter_content.return_value = ["4 contributors"]
+            mock_get.side_effect = [not_found, found]
+
+            self.assertEqual(get_huggingface_contributors("fake/model"), 0)
+            self.assertEqual(get_huggingface_contributors("fake/model"), 4)
+
+    def test_count_split_across_chunks(self) -> None:
+        """Ensure a count split between chunks is found and ends the read."""
+        with patch("requests.Session.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            chunks = iter(["<span>1", "2 contrib", "utors</span>", "files"])
+            mock_response.iter_content.return_value = chunks
+            mock_get.return_value = mock_response
+
+            result = get_huggingface_contributors("fake/model")
+            self.assertEqual(result, 12)
+            self.assertEqual(next(chunks), "files")
+            mock_response.close.assert_called_once()
+
 
 def run_timing_tests() -> bool:
     """Run all tests with detailed timing information."""
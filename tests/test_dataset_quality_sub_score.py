@@ -141,6 +141,15 @@ class TestDocumentationEvaluation:
         score = dataset_quality.evaluate_dataset_documentation(README_EMPTY)
         assert score == 0.0
 
+    def test_evaluate_dataset_documentation_prelowered(self) -> None:
+        """Test a caller-supplied lowercase README gives the same score."""
+        score = dataset_quality.evaluate_dataset_documentation(
+            README_WITH_DOCUMENTATION, README_WITH_DOCUMENTATION.lower()
+        )
+        assert score == dataset_quality.evaluate_dataset_documentation(
+            README_WITH_DOCUMENTATION
+        )
+
 
 class TestLicenseEvaluation:
     """Test license clarity evaluation."""
@@ -296,6 +305,60 @@ class TestHybridEvaluation:
         )
         assert score == deterministic_score
 
+    @patch("src.dataset_quality_sub_score.PurdueGenAI")
+    def test_ai_responses_memoized(self, mock_client_cls: Mock) -> None:
+        """Test that identical AI prompts only reach the LLM once."""
+        dataset_quality._ask_ai.cache_clear()
+        mock_client_cls.return_value.chat.return_value = "0.7"
+
+        first = dataset_quality._get_ai_score(
+            README_WITH_SAFETY, "memo-model", "safety")
+        second = dataset_quality._get_ai_score(
+            README_WITH_SAFETY, "memo-model", "safety")
+
+        assert first == second == 0.7
+        assert mock_client_cls.return_value.chat.call_count == 1
+
+    @patch("src.dataset_quality_sub_score.PurdueGenAI")
+    def test_ai_scores_batched(self, mock_client_cls: Mock) -> None:
+        """Test that all three aspects come from a single AI call."""
+        dataset_quality._ask_ai.cache_clear()
+        mock_client_cls.return_value.chat.return_value = (
+            "documentation: 0.75\nSafety: 1.5\ncuration - n/a")
+
+        scores = dataset_quality._get_ai_scores(
+            README_WITH_SAFETY, "batch-model")
+
+        assert scores == {
+            "documentation": 0.75, "safety": 0.0, "curation": 0.0}
+        assert mock_client_cls.return_value.chat.call_count == 1
+
+    @pytest.mark.parametrize("reply, expected", [
+        ("documentation (1-10): 7", 0.0),
+        ("documentation schema 2.0 compliance: 0.8", 0.0),
+        ("Documentation = 0.6 ", 0.6),
+        ("documentation: 1.5\ndocumentation: 0.4", 0.4),
+    ])
+    @patch("src.dataset_quality_sub_score.PurdueGenAI")
+    def test_ai_scores_take_number_after_separator(
+            self, mock_client_cls: Mock, reply: str, expected: float) -> None:
+        """Test that only an in-range number ending the line is a score."""
+        dataset_quality._ask_ai.cache_clear()
+        mock_client_cls.return_value.chat.return_value = reply
+
+        scores = dataset_quality._get_ai_scores(
+            README_WITH_SAFETY, "reply-model")
+
+        assert scores["documentation"] == expected
+
+    def test_ai_prompts_share_criteria(self) -> None:
+        """Test that per-aspect prompts ask what the batched prompt asks."""
+        batch_lines = dataset_quality._AI_BATCH_PROMPT.splitlines()
+
+        for aspect in dataset_quality.AI_ASPECTS:
+            prompt = dataset_quality._AI_PROMPTS[aspect]
+            assert set(prompt.splitlines()) <= set(batch_lines)
+
 
 class TestDatasetIdentifierExtraction:
     """Test dataset identifier extraction functionality."""
@@ -395,6 +458,8 @@ class TestDatasetAvailabilityScoring:
 
         assert score > 0.0
         assert elapsed >= 0
+        # The README fetched for the known-dataset check is reused
+        mock_fetch_readme.assert_called_once_with("test-model")
 
     @patch("src.dataset_quality_sub_score.fetch_readme")
     def test_dataset_tracking_updates_encountered_set(
@@ -476,6 +541,22 @@ class TestDatasetQualitySubScore:
         assert elapsed >= 0
         assert score == 0.0  # Empty README should score 0
 
+    @patch("src.dataset_quality_sub_score.fetch_readme")
+    def test_dataset_quality_sub_score_ignores_text_past_cap(
+        self, mock_fetch_readme: Mock
+    ) -> None:
+        """Test that text beyond MAX_README_CHARS is not scored."""
+        mock_fetch_readme.return_value = (
+            "x" * dataset_quality.MAX_README_CHARS + README_COMPREHENSIVE
+        )
+
+        score, _ = dataset_quality.dataset_quality_sub_score(
+            "test-model", dataset_link="https://huggingface.co/datasets/test",
+            use_ai=False
+        )
+
+        assert score == 0.0
+
     @patch("src.dataset_quality_sub_score.fetch_readme")
     def test_dataset_quality_sub_score_timing(
         self, mock_fetch_readme: Mock
@@ -509,13 +590,15 @@ class TestDatasetQualitySubScore:
         # Should be deterministic scoring only
 
     @patch("src.dataset_quality_sub_score.fetch_readme")
-    @patch("src.dataset_quality_sub_score._get_ai_score")
+    @patch("src.dataset_quality_sub_score._get_ai_scores")
     def test_dataset_quality_sub_score_with_ai(
-        self, mock_ai_score: Mock, mock_fetch_readme: Mock
+        self, mock_ai_scores: Mock, mock_fetch_readme: Mock
     ) -> None:
         """Test dataset quality scoring with AI enhancement."""
         mock_fetch_readme.return_value = README_COMPREHENSIVE
-        mock_ai_score.return_value = 0.9  # High AI score
+        # High AI score for every aspect
+        mock_ai_scores.return_value = dict.fromkeys(
+            dataset_quality.AI_ASPECTS, 0.9)
 
         score_with_ai, elapsed = dataset_quality.dataset_quality_sub_score(
             "test-model",
@@ -609,5 +692,22 @@ def test_weight_distribution() -> None:
         assert 0.0 <= score <= 1.0, "Score should be between 0.0 and 1.0"
 
 
+@patch("requests.Session.get")
+def test_readme_downloaded_once_across_metrics(mock_get: Mock) -> None:
+    """Test that the README-reading metrics share a single download."""
+    from src import available_dataset_code_score, license_sub_score
+
+    license_sub_score._download_readme.cache_clear()
+    mock_get.return_value = Mock(text="---\nlicense: mit\n---\n# Model")
+
+    license_sub_score.license_sub_score("org/shared-readme")
+    dataset_quality.dataset_quality_sub_score("org/shared-readme",
+                                              use_ai=False)
+    available_dataset_code_score.available_dataset_code_score(
+        "org/shared-readme")
+
+    assert mock_get.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
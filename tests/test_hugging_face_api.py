@@ -29,6 +29,11 @@ MINIMAL_MODEL_RESPONSE: Dict[str, Any] = {
 EMPTY_MODEL_RESPONSE: Dict[str, Any] = {}
 
 
+@pytest.fixture(autouse=True)
+def clear_model_info_cache() -> None:
+    hugging_face_api._fetch_model_info.cache_clear()
+
+
 @pytest.mark.parametrize(
     "model_id,expected_success",
     [
@@ -38,6 +43,8 @@ EMPTY_MODEL_RESPONSE: Dict[str, Any] = {}
         ("", False),
         ("   ", False),
         ("facebook/bart-large", True),
+        ("org/model/extra", False),
+        ("bad model", False),
     ],
 )  # type: ignore[misc]
 def test_get_model_info_inputs(
@@ -50,7 +57,8 @@ def test_get_model_info_inputs(
         mock_resp.json.return_value = VALID_MODEL_RESPONSE
         return mock_resp
 
-    monkeypatch.setattr("requests.get", mock_requests_get)
+    monkeypatch.setattr(hugging_face_api, "SESSION",
+                        Mock(get=mock_requests_get))
 
     model_info, elapsed = hugging_face_api.get_model_info(model_id)
 
@@ -63,7 +71,7 @@ def test_get_model_info_inputs(
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_success(mock_get: Mock) -> None:
     """Test successful API call with full response."""
     mock_resp = Mock()
@@ -86,7 +94,7 @@ def test_get_model_info_success(mock_get: Mock) -> None:
     assert kwargs["timeout"] == 10
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_minimal_response(mock_get: Mock) -> None:
     """Test handling of minimal API response."""
     mock_resp = Mock()
@@ -101,7 +109,7 @@ def test_get_model_info_minimal_response(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_empty_response(mock_get: Mock) -> None:
     """Test handling of empty but valid JSON response."""
     mock_resp = Mock()
@@ -117,7 +125,7 @@ def test_get_model_info_empty_response(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_http_404(mock_get: Mock) -> None:
     """Test handling of 404 Not Found."""
     mock_resp = Mock()
@@ -132,7 +140,7 @@ def test_get_model_info_http_404(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_http_500(mock_get: Mock) -> None:
     """Test handling of server errors."""
     mock_resp = Mock()
@@ -147,7 +155,7 @@ def test_get_model_info_http_500(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_timeout(mock_get: Mock) -> None:
     """Test handling of request timeout."""
     mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
@@ -158,7 +166,7 @@ def test_get_model_info_timeout(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_connection_error(mock_get: Mock) -> None:
     """Test handling of network connection errors."""
     mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -170,7 +178,7 @@ def test_get_model_info_connection_error(mock_get: Mock) -> None:
     assert elapsed >= 0
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_json_decode_error(mock_get: Mock) -> None:
     """Test handling of malformed JSON response."""
     mock_resp = Mock()
@@ -186,7 +194,7 @@ def test_get_model_info_json_decode_error(mock_get: Mock) -> None:
 
 def test_get_model_info_strips_whitespace() -> None:
     """Test that model_id whitespace is properly stripped."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
         mock_resp.json.return_value = VALID_MODEL_RESPONSE
@@ -201,7 +209,7 @@ def test_get_model_info_strips_whitespace() -> None:
         assert "  " not in args[0]
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_model_info_api_url_construction(mock_get: Mock) -> None:
     """Test that API URLs are constructed correctly."""
     mock_resp = Mock()
@@ -218,7 +226,7 @@ def test_get_model_info_api_url_construction(mock_get: Mock) -> None:
 
 def test_timing_measurement() -> None:
     """Test that execution time is properly measured."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
         mock_resp.json.return_value = VALID_MODEL_RESPONSE
@@ -231,7 +239,7 @@ def test_timing_measurement() -> None:
 
 
 @patch("os.getenv")
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_log_level_environment_variable(mock_get: Mock,
                                         mock_getenv: Mock) -> None:
     """Test that LOG_LEVEL environment variable controls error printing."""
@@ -246,3 +254,54 @@ def test_log_level_environment_variable(mock_get: Mock,
     mock_getenv.return_value = "1"
     model_info, elapsed = hugging_face_api.get_model_info("test/model")
     assert model_info is None
+
+
+@patch("requests.Session.get")
+def test_get_model_info_malformed_id_skips_request(mock_get: Mock) -> None:
+    """Test that malformed model IDs are rejected without a request."""
+    for model_id in ("org/model/extra", "bad model", "org//model", "/"):
+        model_info, elapsed = hugging_face_api.get_model_info(model_id)
+        assert model_info is None
+        assert elapsed >= 0
+
+    mock_get.assert_not_called()
+
+
+@patch("requests.Session.get")
+def test_get_model_info_cached(mock_get: Mock) -> None:
+    """Test that repeat lookups of a model reuse the first response."""
+    mock_resp = Mock()
+    mock_resp.raise_for_status = Mock()
+    mock_resp.json.return_value = VALID_MODEL_RESPONSE
+    mock_get.return_value = mock_resp
+
+    first, _ = hugging_face_api.get_model_info("gpt2")
+    second, _ = hugging_face_api.get_model_info(" gpt2 ")
+
+    assert first == second == VALID_MODEL_RESPONSE
+    mock_get.assert_called_once()
+
+
+@patch("requests.Session.get")
+def test_get_model_info_failure_not_cached(mock_get: Mock) -> None:
+    """Test that a failed lookup is retried on the next call."""
+    mock_resp = Mock()
+    mock_resp.raise_for_status = Mock()
+    mock_resp.json.return_value = VALID_MODEL_RESPONSE
+    mock_get.side_effect = [
+        requests.exceptions.ConnectionError("Connection failed"), mock_resp]
+
+    model_info, _ = hugging_face_api.get_model_info("gpt2")
+    assert model_info is None
+
+    model_info, _ = hugging_face_api.get_model_info("gpt2")
+    assert model_info == VALID_MODEL_RESPONSE
+    assert mock_get.call_count == 2
+
+
+def test_session_shared_by_metric_modules() -> None:
+    """Test that the README and Files page fetches use this session."""
+    from src import bus_factor, license_sub_score
+
+    assert vars(license_sub_score)["SESSION"] is hugging_face_api.SESSION
+    assert vars(bus_factor)["SESSION"] is hugging_face_api.SESSION
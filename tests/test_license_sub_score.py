@@ -36,6 +36,11 @@ GPL-2.0
 README_EMPTY: str = ""
 
 
+@pytest.fixture(autouse=True)
+def clear_readme_cache() -> None:
+    license._download_readme.cache_clear()
+
+
 @pytest.mark.parametrize(
     "readme_text,expected_score",
     [
@@ -90,7 +95,7 @@ def test_extract_license_multiple() -> None:
     assert license_str.lower() == "mit"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_readme_success(mock_get: Mock) -> None:
     mock_resp: Mock = Mock()
     mock_resp.raise_for_status = Mock()
@@ -103,7 +108,7 @@ def test_fetch_readme_success(mock_get: Mock) -> None:
     assert "MIT" in result
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_readme_tree_main(mock_get: Mock) -> None:
     mock_resp: Mock = Mock()
     mock_resp.raise_for_status = Mock()
@@ -116,7 +121,31 @@ def test_fetch_readme_tree_main(mock_get: Mock) -> None:
     assert result == "Tree main README"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
+def test_fetch_readme_cached(mock_get: Mock) -> None:
+    mock_resp: Mock = Mock()
+    mock_resp.raise_for_status = Mock()
+    mock_resp.text = README_YAML
+    mock_get.return_value = mock_resp
+
+    first: Optional[str] = license.fetch_readme("mock-org/mock-model")
+    second: Optional[str] = license.fetch_readme("mock-org/mock-model")
+    assert first == second == README_YAML
+    assert mock_get.call_count == 1
+
+
+@patch("requests.Session.get")
+def test_fetch_readme_failure_not_cached(mock_get: Mock) -> None:
+    mock_resp: Mock = Mock()
+    mock_resp.raise_for_status = Mock()
+    mock_resp.text = README_YAML
+    mock_get.side_effect = [Exception("Network error"), mock_resp]
+
+    assert license.fetch_readme("mock-org/mock-model") is None
+    assert license.fetch_readme("mock-org/mock-model") == README_YAML
+
+
+@patch("requests.Session.get")
 def test_fetch_readme_failure(mock_get: Mock) -> None:
     mock_get.side_effect = Exception("Network error")
     result: Optional[str] = license.fetch_readme(
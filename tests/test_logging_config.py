@@ -10,6 +10,7 @@ Tests cover:
 - Error logging with context
 """
 
+import json
 import logging
 import os
 import shutil
@@ -20,6 +21,7 @@ from unittest.mock import patch
 
 import pytest
 
+from src import logging_config
 from src.logging_config import (LoggerManager, LoggingConfig, get_logger,
                                 log_error_with_context, log_function_call,
                                 log_performance, set_log_level)
@@ -248,6 +250,31 @@ class TestEnvironmentConfiguration:
             assert config.backup_count == 3
 
 
+class TestCorrelationId:
+    """Test correlation ID stamping on log records."""
+
+    def setup_method(self) -> None:
+        """Save the global record factory."""
+        self.old_factory = logging.getLogRecordFactory()
+
+    def teardown_method(self) -> None:
+        """Restore the global record factory."""
+        logging.setLogRecordFactory(self.old_factory)
+        logging_config._record_factory_installed = False
+
+    def test_set_correlation_id_installs_factory_once(self) -> None:
+        """Test that changing the ID reuses the installed factory."""
+        manager = LoggerManager()
+        manager.set_correlation_id("req_1")
+        factory = logging.getLogRecordFactory()
+        manager.set_correlation_id("req_2")
+
+        assert logging.getLogRecordFactory() is factory
+        record = factory("test", logging.INFO, "test.py", 10, "msg", (),
+                         None)
+        assert getattr(record, "correlation_id") == "req_2"
+
+
 class TestJsonFormatter:
     """Test JSON formatter functionality."""
 
@@ -272,6 +299,25 @@ class TestJsonFormatter:
         assert "message" in formatted
         assert "Test message" in formatted
 
+    def test_json_formatting_is_valid_json(self) -> None:
+        """Test that formatted records parse as JSON."""
+        from src.logging_config import JsonFormatter
+
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.WARNING,
+            pathname="test.py",
+            lineno=10,
+            msg="Quote ' and \"double\" quote",
+            args=(),
+            exc_info=None
+        )
+
+        entry = json.loads(formatter.format(record))
+        assert entry["level"] == "WARNING"
+        assert entry["message"] == "Quote ' and \"double\" quote"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
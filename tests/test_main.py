@@ -1,14 +1,20 @@
 import os
 import sys
 import tempfile
+import time
 import unittest
+from collections import Counter
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Add the src directory to the path so we can import main
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from main import calculate_all_scores, extract_model_name, main  # noqa: E402
+import bus_factor  # noqa: E402
+import hugging_face_api  # noqa: E402
+import license_sub_score  # noqa: E402
+from main import (calculate_all_scores, extract_model_name,  # noqa: E402
+                  load_known_resources, main, save_known_resources)
 
 
 class TestMain(unittest.TestCase):
@@ -243,6 +249,53 @@ class TestMain(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_known_resources_round_trip(self) -> None:
+        """Test that encountered resources persist through the index file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "known_resources.json")
+            save_known_resources(path, {"squad/v2"}, {"google/bert"})
+            datasets, code = load_known_resources(path)
+            self.assertEqual(datasets, {"squad/v2"})
+            self.assertEqual(code, {"google/bert"})
+
+    def test_load_known_resources_missing_file(self) -> None:
+        """Test that a missing index file starts from empty sets."""
+        datasets, code = load_known_resources("nonexistent_index.json")
+        self.assertEqual(datasets, set())
+        self.assertEqual(code, set())
+
+    def test_calculate_all_scores_fetches_each_page_once(self) -> None:
+        """Test that the metrics share one fetch of every page per model."""
+        bus_factor._count_contributors.cache_clear()
+        hugging_face_api._fetch_model_info.cache_clear()
+        license_sub_score._download_readme.cache_clear()
+        fetched: Counter[str] = Counter()
+
+        def fake_get(url: str, **kwargs: Any) -> MagicMock:
+            # Slow enough that concurrent metrics would overlap on a miss
+            time.sleep(0.05)
+            if url.endswith("/README.md"):
+                fetched["readme"] += 1
+            elif "/api/models/" in url:
+                fetched["model_info"] += 1
+            elif url.endswith("/tree/main"):
+                fetched["files_page"] += 1
+            else:
+                fetched[url] += 1
+            response = MagicMock(status_code=200)
+            response.text = "# Model\n\nlicense: mit\n"
+            response.json.return_value = {"downloads": 10, "likes": 1}
+            response.iter_content.return_value = ["<span>3 contributors"]
+            return response
+
+        with patch('requests.Session.get', side_effect=fake_get):
+            result = calculate_all_scores(
+                "", "", "https://huggingface.co/test/model", set(), set())
+
+        self.assertEqual(fetched, Counter(
+            {"readme": 1, "model_info": 1, "files_page": 1}))
+        self.assertEqual(result["bus_factor"], 0.15)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -359,6 +359,37 @@ class TestNetScoreCalculator(unittest.TestCase):
                 # If it does crash, that's also acceptable behavior
                 self.assertIsInstance(e, Exception)
 
+    def test_precomputed_results_skip_metric_calls(self) -> None:
+        """Test that supplied metric results are used instead of rescoring."""
+        metric_results = {
+            "license": (1.0, 0.1),
+            "ramp_up_time": (0.8, 0.2),
+            "bus_factor": (10, 0.3),
+            "dataset_and_code_score": (0.5, 0.15),
+            "dataset_quality": (0.7, 0.12),
+        }
+
+        with patch('net_score_calculator.license_sub_score') as \
+             mock_license, \
+             patch('net_score_calculator.bus_factor_score') as \
+             mock_bus_factor, \
+             patch('net_score_calculator.performance_claims_sub_score') \
+             as mock_performance:
+
+            mock_performance.return_value = (0.9, 0.08)
+
+            results = calculate_net_score("gpt2", metric_results)
+
+            mock_license.assert_not_called()
+            mock_bus_factor.assert_not_called()
+            # Metrics the caller did not supply are still computed here
+            mock_performance.assert_called_once_with("gpt2")
+            self.assertEqual(results["bus_factor"], 0.5)
+            self.assertEqual(results["license_latency"], 100)
+            expected = (0.05 * 0.5 + 0.2 * 1.0 + 0.2 * 0.8 + 0.05 * 0.5 +
+                        0.15 * 0.5 + 0.15 * 0.7 + 0.1 * 0.5 + 0.1 * 0.9)
+            self.assertAlmostEqual(results["net_score"], expected, places=6)
+
 
 class TestNetScoreWithRealModels(unittest.TestCase):
     """Integration tests with real Hugging Face models (may be slow)."""
@@ -70,6 +70,25 @@ class TestPurdueGenAI(unittest.TestCase):
             client.chat("Hello")
         self.assertIn("API Error 400", str(context.exception))
 
+    @patch('urllib.request.urlopen')
+    def test_chat_invalid_format(self, mock_urlopen: Mock) -> None:
+        """Test chat with a response missing the message content."""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.read.return_value = json.dumps({
+            "choices": [{"message": {}}]
+        }).encode('utf-8')
+
+        mock_context = Mock()
+        mock_context.__enter__ = Mock(return_value=mock_response)
+        mock_context.__exit__ = Mock(return_value=None)
+        mock_urlopen.return_value = mock_context
+
+        client = purdue_api.PurdueGenAI(api_key="test_key")
+        with self.assertRaises(Exception) as context:
+            client.chat("Hello")
+        self.assertIn("Invalid response format", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()